@@ -12,6 +12,7 @@ from claude_clone.core.plan import PlanManager
 from claude_clone.core.session import SessionManager
 from claude_clone.llm.ollama_provider import Message, OllamaProvider
 from claude_clone.tools.registry import ToolRegistry
+from claude_clone.tools.web import close_http_client
 from claude_clone.ui.console import ChatConsole
 
 
@@ -322,6 +323,8 @@ async def run_repl(
         except Exception as e:
             console.print_error(str(e))
 
+    await close_http_client()
+
 
 @click.command()
 @click.option(
@@ -402,6 +405,7 @@ def main(
             # In single-prompt mode, show what we're processing
             console.print_info(f"> {prompt}")
             await agent.process_message(prompt)
+            await close_http_client()
 
         try:
             asyncio.run(run_single_prompt())
@@ -151,7 +151,7 @@ class Agent:
                     # Only stream if it doesn't look like a tool call
                     if not looks_like_tool_call:
                         if not streaming_started:
-                            self.console.stop_status()
+                            # start_streaming takes over the spinner's Live display
                             self.console.start_streaming()
                             streaming_started = True
                         self.console.stream_chunk(chunk.content)
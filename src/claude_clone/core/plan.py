@@ -6,6 +6,14 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+# Checkbox shown before each step in a plan's markdown, by step status
+STEP_STATUS_ICONS = {
+    "pending": "[ ]",
+    "in_progress": "[>]",
+    "completed": "[x]",
+    "skipped": "[-]",
+}
+
 
 class PlanStatus(Enum):
     """Status of a plan."""
@@ -43,9 +51,31 @@ class Plan:
     steps: list[PlanStep]
     status: PlanStatus = PlanStatus.DRAFTING
     created_at: datetime = field(default_factory=datetime.now)
+    # (render key, markdown) from the last to_markdown() call
+    _markdown_cache: tuple[tuple[Any, ...], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _markdown_key(self) -> tuple[Any, ...]:
+        """Return everything to_markdown() output depends on."""
+        return (
+            self.goal,
+            self.status,
+            self.created_at,
+            tuple((s.description, s.status, tuple(s.files_affected)) for s in self.steps),
+        )
 
     def to_markdown(self) -> str:
-        """Render plan as markdown."""
+        """Render plan as markdown, reusing the last render if nothing changed."""
+        key = self._markdown_key()
+        if self._markdown_cache is not None and self._markdown_cache[0] == key:
+            return self._markdown_cache[1]
+        markdown = self._render_markdown()
+        self._markdown_cache = (key, markdown)
+        return markdown
+
+    def _render_markdown(self) -> str:
+        """Build the markdown for to_markdown()."""
         lines = [
             f"# Plan: {self.goal}",
             "",
@@ -57,18 +87,9 @@ class Plan:
         ]
 
         for i, step in enumerate(self.steps, 1):
-            status_icon = {
-                "pending": "[ ]",
-                "in_progress": "[>]",
-                "completed": "[x]",
-                "skipped": "[-]",
-            }.get(step.status, "[ ]")
-
+            status_icon = STEP_STATUS_ICONS.get(step.status, "[ ]")
             lines.append(f"{i}. {status_icon} {step.description}")
-
-            if step.files_affected:
-                for f in step.files_affected:
-                    lines.append(f"   - `{f}`")
+            lines.extend(f"   - `{f}`" for f in step.files_affected)
 
         return "\n".join(lines)
 
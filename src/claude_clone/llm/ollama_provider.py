@@ -10,6 +10,75 @@ from ollama import AsyncClient
 
 from claude_clone.config import Settings, get_model_config
 
+# One client (and connection pool) per host, shared by every provider so
+# switching models keeps the warm keep-alive connections to Ollama
+_client_cache: dict[str, AsyncClient] = {}
+
+
+def get_client(host: str) -> AsyncClient:
+    """Get the shared AsyncClient for a host, creating it on first use."""
+    client = _client_cache.get(host)
+    if client is None:
+        client = _client_cache[host] = AsyncClient(host=host)
+    return client
+
+
+# Known tool names for the "tool_name {...}" / "tool_name({...})" formats
+KNOWN_TOOLS = (
+    "read_file", "write_file", "edit_file", "grep", "glob",
+    "bash", "git_status", "git_diff", "git_commit", "git_log", "git_branch",
+    "web_search", "web_fetch", "create_plan", "todo_write",
+)
+
+_CONTROL_TOKEN_RE = re.compile(r'<\|[^|]+\|>')
+_MALFORMED_NAME_RE = re.compile(r'\{name" ?:')
+# Group 1 is the tool name, group 2 is set when the call uses parens
+_TOOL_PREFIX_RE = re.compile(r'(' + '|'.join(KNOWN_TOOLS) + r')\s*(\(\s*)?\{')
+# Characters that can change brace depth or string state
+_STRUCTURAL_RE = re.compile(r'[{}"\\]')
+
+
+def scan_json_spans(text: str, start: int = 0) -> dict[int, int]:
+    """
+    Map the index of every "{" the scan opens to the end of its object, or -1.
+
+    Single linear pass from start, outside any string, keeping a stack of
+    open braces so nested objects are recorded too. Quotes only toggle
+    string state inside an object, which keeps stray quotes in surrounding
+    prose from hiding the JSON. Every recorded "{" gets the same result a
+    fresh scan starting at it would; a "{" the scan saw inside a string is
+    not recorded and needs its own scan. The regex jumps straight to
+    structural characters so ordinary text is skipped in C.
+    """
+    spans: dict[int, int] = {}
+    stack: list[int] = []
+    in_string = False
+    escaped = -1  # Index of the character escaped by the last backslash
+
+    for match in _STRUCTURAL_RE.finditer(text, start):
+        j = match.start()
+        if j == escaped:
+            continue
+        char = match.group()
+
+        if in_string:
+            if char == '\\':
+                escaped = j + 1
+            elif char == '"':
+                in_string = False
+        elif char == '{':
+            stack.append(j)
+        elif char == '}':
+            if stack:
+                spans[stack.pop()] = j + 1
+        elif char == '"' and stack:
+            in_string = True
+
+    # Never closed
+    for j in stack:
+        spans[j] = -1
+    return spans
+
 
 def extract_json_tool_call(content: str) -> tuple[str | None, list["ToolCall"]]:
     """
@@ -28,119 +97,75 @@ def extract_json_tool_call(content: str) -> tuple[str | None, list["ToolCall"]]:
     tool_calls = []
     matches = []
 
-    # Known tool names to look for
-    known_tools = [
-        "read_file", "write_file", "edit_file", "grep", "glob",
-        "bash", "git_status", "git_diff", "git_commit", "git_log", "git_branch",
-        "web_search", "web_fetch", "create_plan", "todo_write"
-    ]
-
-    def find_balanced_json(text: str, start_idx: int) -> tuple[str | None, int]:
-        """Find a balanced JSON object starting at start_idx. Returns (json_str, end_idx) or (None, -1)."""
-        if start_idx >= len(text) or text[start_idx] != '{':
-            return None, -1
-
-        brace_count = 0
-        bracket_count = 0
-        in_string = False
-        escape_next = False
-        j = start_idx
-
-        while j < len(text):
-            char = text[j]
-
-            if escape_next:
-                escape_next = False
-                j += 1
-                continue
-
-            if char == '\\' and in_string:
-                escape_next = True
-                j += 1
-                continue
-
-            if char == '"' and not escape_next:
-                in_string = not in_string
-            elif not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        return text[start_idx:j + 1], j + 1
-                elif char == '[':
-                    bracket_count += 1
-                elif char == ']':
-                    bracket_count -= 1
-
-            j += 1
-
-        return None, -1
-
     # Clean up common model artifacts before parsing
     # Remove control tokens like <|im_start|>, <|im_end|>
-    cleaned = re.sub(r'<\|[^|]+\|>', '', content)
+    cleaned = _CONTROL_TOKEN_RE.sub('', content)
     # Fix malformed JSON: {name": -> {"name":
-    cleaned = re.sub(r'\{name":', '{"name":', cleaned)
-    cleaned = re.sub(r'\{name" :', '{"name":', cleaned)
-
-    # First, try to find {"name": ..., "arguments": ...} format
-    i = 0
-    while i < len(cleaned):
-        if cleaned[i] == '{':
-            json_str, end_idx = find_balanced_json(cleaned, i)
-            if json_str:
-                try:
-                    data = json.loads(json_str)
-                    if isinstance(data, dict) and "name" in data and "arguments" in data:
-                        tool_calls.append(ToolCall(
-                            name=data["name"],
-                            arguments=data["arguments"] if isinstance(data["arguments"], dict) else {}
-                        ))
-                        matches.append((i, end_idx))
-                        i = end_idx
-                        continue
-                except json.JSONDecodeError:
-                    pass
-            i += 1
-        else:
-            i += 1
+    cleaned = _MALFORMED_NAME_RE.sub('{"name":', cleaned)
+
+    # Object ends by start index, shared by both formats below
+    spans: dict[int, int] = {}
+
+    def object_end(start: int) -> int:
+        """Return the end of the balanced object at start, or -1."""
+        if start not in spans:
+            # Only reached for a "{" an earlier scan saw inside a string
+            spans.update(scan_json_spans(cleaned, start))
+        return spans[start]
+
+    # First, try to find {"name": ..., "arguments": ...} format.
+    # Objects nested inside an accepted tool call are skipped.
+    start = cleaned.find("{")
+    while start != -1:
+        end = object_end(start)
+        if end != -1:
+            try:
+                data = json.loads(cleaned[start:end])
+            except json.JSONDecodeError:
+                data = None
+            if isinstance(data, dict) and "name" in data and "arguments" in data:
+                tool_calls.append(ToolCall(
+                    name=data["name"],
+                    arguments=data["arguments"] if isinstance(data["arguments"], dict) else {}
+                ))
+                matches.append((start, end))
+                start = cleaned.find("{", end)
+                continue
+        start = cleaned.find("{", start + 1)
 
     # If no standard format found, try "tool_name {...}" or "tool_name({...})" formats
     if not tool_calls:
-        for tool_name in known_tools:
-            # Pattern: tool_name { ... } or tool_name({ ... })
-            patterns = [
-                (tool_name + r'\s*\(\s*\{', 2),  # tool_name({ - need to skip "(" before "{"
-                (tool_name + r'\s*\{', 0),       # tool_name { - brace immediately follows
-            ]
-
-            for pattern, offset_adjust in patterns:
-                for match in re.finditer(pattern, cleaned):
-                    # Find the opening brace
-                    brace_start = match.end() - 1
-                    json_str, end_idx = find_balanced_json(cleaned, brace_start)
-
-                    if json_str:
-                        try:
-                            args = json.loads(json_str)
-                            if isinstance(args, dict):
-                                tool_calls.append(ToolCall(name=tool_name, arguments=args))
-                                # Adjust match bounds to include tool name and optional parens
-                                match_end = end_idx
-                                # Check for closing paren if we had opening paren
-                                if offset_adjust == 2 and match_end < len(cleaned) and cleaned[match_end:match_end+1] == ')':
-                                    match_end += 1
-                                matches.append((match.start(), match_end))
-                        except json.JSONDecodeError:
-                            pass
+        found = []
+        for match in _TOOL_PREFIX_RE.finditer(cleaned):
+            brace_start = match.end() - 1
+            end_idx = object_end(brace_start)
+            if end_idx == -1:
+                continue
+            try:
+                args = json.loads(cleaned[brace_start:end_idx])
+            except json.JSONDecodeError:
+                continue
+            if isinstance(args, dict):
+                # Include the closing paren if the call opened one
+                if match.group(2) and cleaned.startswith(")", end_idx):
+                    end_idx += 1
+                # Ordered by tool, then call style, then position, as one search per tool would
+                key = (KNOWN_TOOLS.index(match.group(1)), not match.group(2), match.start())
+                found.append((key, ToolCall(name=match.group(1), arguments=args), end_idx))
+        for (_, _, start), call, end_idx in sorted(found, key=lambda item: item[0]):
+            tool_calls.append(call)
+            matches.append((start, end_idx))
 
     # If we found tool calls, remove them from cleaned content
     if tool_calls:
-        remaining = cleaned
-        for start, end in reversed(sorted(matches)):  # Sort and reverse to maintain positions
-            remaining = remaining[:start] + remaining[end:]
-        remaining = remaining.strip()
+        pieces = []
+        pos = 0
+        for start, end in sorted(matches):
+            if start > pos:
+                pieces.append(cleaned[pos:start])
+            pos = max(pos, end)
+        pieces.append(cleaned[pos:])
+        remaining = "".join(pieces).strip()
         return remaining if remaining else None, tool_calls
 
     # Return cleaned content even if no tool calls (removes control tokens)
@@ -148,7 +173,7 @@ def extract_json_tool_call(content: str) -> tuple[str | None, list["ToolCall"]]:
     return cleaned if cleaned else content, []
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Represents a tool call from the model."""
 
@@ -156,7 +181,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatChunk:
     """A chunk from the streaming response."""
 
@@ -165,7 +190,7 @@ class ChatChunk:
     done: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A chat message."""
 
@@ -201,10 +226,16 @@ class OllamaProvider:
     ):
         self.model = model
         self.host = host
-        self.client = AsyncClient(host=host)
+        self.client = get_client(host)
         self.settings = settings or Settings()
         self.model_config = get_model_config(model)
 
+        # Request options only depend on settings, so build them once
+        self.options: dict[str, Any] = {
+            "temperature": self.settings.temperature,
+            "num_ctx": self.settings.num_ctx,
+        }
+
     async def chat(
         self,
         messages: list[Message],
@@ -225,12 +256,6 @@ class OllamaProvider:
         # Convert messages to Ollama format
         ollama_messages = [msg.to_dict() for msg in messages]
 
-        # Prepare options
-        options = {
-            "temperature": self.settings.temperature,
-            "num_ctx": self.settings.num_ctx,
-        }
-
         try:
             if stream:
                 async for chunk in await self.client.chat(
@@ -238,7 +263,7 @@ class OllamaProvider:
                     messages=ollama_messages,
                     tools=tools,
                     stream=True,
-                    options=options,
+                    options=self.options,
                 ):
                     yield self._parse_chunk(chunk)
             else:
@@ -247,7 +272,7 @@ class OllamaProvider:
                     messages=ollama_messages,
                     tools=tools,
                     stream=False,
-                    options=options,
+                    options=self.options,
                 )
                 yield self._parse_response(response)
 
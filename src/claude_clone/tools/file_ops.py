@@ -1,9 +1,25 @@
 """File operation tools: Read, Write, Edit."""
 
+import stat
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from claude_clone.tools.base import Tool, ToolResult
+from claude_clone.tools.search import scan_cache
+
+
+def iter_lines(content: str) -> Iterator[str]:
+    """Yield lines of content one at a time without building a full list."""
+    start = 0
+    end = len(content)
+    while start < end:
+        newline = content.find("\n", start)
+        if newline == -1:
+            yield content[start:].rstrip("\r")
+            return
+        yield content[start:newline].rstrip("\r")
+        start = newline + 1
 
 
 class ReadFileTool(Tool):
@@ -38,20 +54,23 @@ class ReadFileTool(Tool):
         try:
             path = Path(file_path).expanduser().resolve()
 
-            if not path.exists():
+            # One stat call covers both the existence and regular-file checks
+            try:
+                st = path.stat()
+            except FileNotFoundError:
                 return ToolResult.fail(f"File not found: {file_path}")
 
-            if not path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 return ToolResult.fail(f"Not a file: {file_path}")
 
-            # Read file content
+            # Read raw bytes and decode once; splitlines() below handles
+            # \r\n the same way universal-newline text mode would
+            raw = path.read_bytes()
             try:
-                content = path.read_text(encoding="utf-8")
+                content = raw.decode("utf-8")
             except UnicodeDecodeError:
-                # Try reading as binary and showing info
-                size = path.stat().st_size
                 return ToolResult.fail(
-                    f"Cannot read binary file: {file_path} (size: {size} bytes)"
+                    f"Cannot read binary file: {file_path} (size: {len(raw)} bytes)"
                 )
 
             lines = content.splitlines()
@@ -86,7 +105,10 @@ class WriteFileTool(Tool):
     """Write content to a file."""
 
     name = "write_file"
-    description = "Write content to a file, creating it if it doesn't exist. Will overwrite existing content."
+    description = (
+        "Write content to a file, creating it if it doesn't exist. "
+        "Will overwrite existing content."
+    )
     parameters = {
         "file_path": {
             "type": "string",
@@ -116,7 +138,9 @@ class WriteFileTool(Tool):
             existed = path.exists()
 
             # Write the file
-            path.write_text(content, encoding="utf-8")
+            path.write_bytes(content.encode("utf-8"))
+            # Same-size rewrites within the mtime granularity would look unchanged
+            scan_cache.invalidate(path)
 
             if existed:
                 return ToolResult.ok(
@@ -172,51 +196,67 @@ class EditFileTool(Tool):
         try:
             path = Path(file_path).expanduser().resolve()
 
-            if not path.exists():
+            # One stat call covers both the existence and regular-file checks
+            try:
+                st = path.stat()
+            except FileNotFoundError:
                 return ToolResult.fail(f"File not found: {file_path}")
 
-            if not path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 return ToolResult.fail(f"Not a file: {file_path}")
 
-            # Read current content
-            try:
-                content = path.read_text(encoding="utf-8")
-            except UnicodeDecodeError:
+            if not old_content:
+                return ToolResult.fail("old_content must not be empty")
+
+            # Work on raw bytes so a successful edit never decodes or
+            # re-encodes the whole file
+            raw = path.read_bytes()
+            if b"\0" in raw:
                 return ToolResult.fail(f"Cannot edit binary file: {file_path}")
 
-            # Check if old_content exists
-            if old_content not in content:
-                # Try to find similar content for helpful error
-                lines = content.splitlines()
-                first_line = old_content.splitlines()[0] if old_content else ""
+            old_bytes = old_content.encode("utf-8")
+            new_bytes = new_content.encode("utf-8")
+
+            # Match the file's CRLF line endings when the caller sent LF ones
+            if b"\r\n" in raw and b"\r\n" not in old_bytes:
+                old_bytes = old_bytes.replace(b"\n", b"\r\n")
+                new_bytes = new_bytes.replace(b"\n", b"\r\n")
 
+            # Split at most twice: one pass tells us whether the content is
+            # missing, unique, or ambiguous, and gives us the pieces to rejoin
+            parts = raw.split(old_bytes, 2)
+
+            if len(parts) == 1:
+                # Try to find similar content for helpful error
+                content = raw.decode("utf-8", errors="replace")
+                needle = old_content.splitlines()[0].strip()
                 similar = []
-                for i, line in enumerate(lines, 1):
-                    if first_line and first_line.strip() in line:
-                        similar.append(f"  Line {i}: {line[:80]}")
+                if needle:
+                    for i, line in enumerate(iter_lines(content), 1):
+                        if needle in line:
+                            similar.append(f"  Line {i}: {line[:80]}")
+                            if len(similar) >= 3:
+                                break
 
                 hint = ""
                 if similar:
-                    hint = "\n\nSimilar lines found:\n" + "\n".join(similar[:3])
+                    hint = "\n\nSimilar lines found:\n" + "\n".join(similar)
 
                 return ToolResult.fail(
                     f"Content not found in file. Make sure old_content matches exactly, "
                     f"including whitespace and indentation.{hint}"
                 )
 
-            # Count occurrences
-            count = content.count(old_content)
-            if count > 1:
+            if len(parts) > 2:
+                count = 2 + parts[2].count(old_bytes)
                 return ToolResult.fail(
                     f"Found {count} occurrences of the content. "
                     "Please provide more context to make the match unique."
                 )
 
-            # Perform replacement
-            new_file_content = content.replace(old_content, new_content, 1)
-
-            # Write back
-            path.write_text(new_file_content, encoding="utf-8")
+            # Perform replacement and write back
+            path.write_bytes(parts[0] + new_bytes + parts[1])
+            scan_cache.invalidate(path)
 
             # Show what changed
             old_lines = len(old_content.splitlines())
@@ -2,20 +2,47 @@
 
 import asyncio
 import os
+from functools import lru_cache
 from typing import Any
 
 from claude_clone.tools.base import Tool, ToolResult
 
 
-async def run_git_command(args: list[str], cwd: str | None = None) -> tuple[int, str, str]:
-    """Run a git command and return (exit_code, stdout, stderr)."""
-    process = await asyncio.create_subprocess_exec(
+@lru_cache(maxsize=64)
+def split_target(target: str) -> tuple[str, ...]:
+    """Split a diff target into git args, cached since agents repeat targets."""
+    return tuple(target.split())
+
+
+async def _spawn_git(
+    args: list[str],
+    cwd: str | None,
+    readonly: bool,
+) -> asyncio.subprocess.Process:
+    """Start a git process with stdout/stderr piped.
+
+    Read-only callers pass readonly=True so git skips optional locks and
+    does not refresh/write back the index as a side effect of the query.
+    """
+    if readonly:
+        args = ["--no-optional-locks", *args]
+    return await asyncio.create_subprocess_exec(
         "git",
         *args,
+        stdin=asyncio.subprocess.DEVNULL,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
         cwd=cwd or os.getcwd(),
     )
+
+
+async def run_git_command(
+    args: list[str],
+    cwd: str | None = None,
+    readonly: bool = False,
+) -> tuple[int, str, str]:
+    """Run a git command and return (exit_code, stdout, stderr)."""
+    process = await _spawn_git(args, cwd, readonly)
     stdout, stderr = await process.communicate()
     return (
         process.returncode or 0,
@@ -24,6 +51,57 @@ async def run_git_command(args: list[str], cwd: str | None = None) -> tuple[int,
     )
 
 
+async def run_git_command_capped(
+    args: list[str],
+    max_bytes: int,
+    cwd: str | None = None,
+    readonly: bool = False,
+) -> tuple[int, str, str, bool]:
+    """Run a git command, reading at most max_bytes of stdout.
+
+    Once the cap is exceeded the process is killed rather than left to
+    produce output that would only be thrown away.
+
+    Returns (exit_code, stdout, stderr, truncated).
+    """
+    process = await _spawn_git(args, cwd, readonly)
+    assert process.stdout is not None and process.stderr is not None
+
+    # Drain stderr concurrently so git can't block on a full stderr pipe
+    stderr_task = asyncio.create_task(process.stderr.read())
+
+    chunks: list[bytes] = []
+    received = 0
+    truncated = False
+    while True:
+        chunk = await process.stdout.read(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        received += len(chunk)
+        if received > max_bytes:
+            truncated = True
+            # git has often exited by now; signalling it then would reap it
+            # behind asyncio's child watcher, or raise if it's already gone
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+            break
+
+    stderr = await stderr_task
+    await process.wait()
+
+    stdout = b"".join(chunks)[:max_bytes]
+    return (
+        0 if truncated else process.returncode or 0,
+        stdout.decode("utf-8", errors="replace").strip(),
+        stderr.decode("utf-8", errors="replace").strip(),
+        truncated,
+    )
+
+
 class GitStatusTool(Tool):
     """Show git repository status."""
 
@@ -41,8 +119,9 @@ class GitStatusTool(Tool):
         """Get git status."""
         try:
             exit_code, stdout, stderr = await run_git_command(
-                ["status", "--porcelain=v1", "-b"],
+                ["status", "-s", "-b"],
                 cwd=path,
+                readonly=True,
             )
 
             if exit_code != 0:
@@ -50,13 +129,13 @@ class GitStatusTool(Tool):
                     return ToolResult.fail("Not a git repository")
                 return ToolResult.fail(f"Git error: {stderr}")
 
-            if not stdout:
-                return ToolResult.ok("Working tree clean, nothing to commit")
+            # With -b the first line is always the "## branch" header
+            lines = stdout.splitlines()
+            if len(lines) <= 1:
+                header = f"{lines[0]}\n" if lines else ""
+                return ToolResult.ok(f"{header}Working tree clean, nothing to commit")
 
-            # Also get a more readable status
-            _, readable, _ = await run_git_command(["status", "-s", "-b"], cwd=path)
-
-            return ToolResult.ok(readable or stdout)
+            return ToolResult.ok(stdout)
 
         except FileNotFoundError:
             return ToolResult.fail("Git is not installed")
@@ -92,11 +171,16 @@ class GitDiffTool(Tool):
     ) -> ToolResult:
         """Get git diff."""
         try:
-            args = ["diff", "--stat"]
+            # --stat --patch prints the summary followed by the full diff
+            args = ["diff", "--stat", "--patch"]
             if target:
-                args.extend(target.split())
+                args.extend(split_target(target))
 
-            exit_code, stdout, stderr = await run_git_command(args, cwd=path)
+            # Stop reading once the cap is hit instead of slicing afterwards
+            max_len = 10000
+            exit_code, stdout, stderr, truncated = await run_git_command_capped(
+                args, max_len, cwd=path, readonly=True
+            )
 
             if exit_code != 0:
                 return ToolResult.fail(f"Git error: {stderr}")
@@ -104,19 +188,10 @@ class GitDiffTool(Tool):
             if not stdout:
                 return ToolResult.ok("No changes")
 
-            # Get full diff (limited)
-            full_args = ["diff"]
-            if target:
-                full_args.extend(target.split())
-
-            _, full_diff, _ = await run_git_command(full_args, cwd=path)
-
-            # Truncate if too long
-            max_len = 10000
-            if len(full_diff) > max_len:
-                full_diff = full_diff[:max_len] + "\n\n[Diff truncated...]"
+            if truncated:
+                stdout += "\n\n[Diff truncated...]"
 
-            return ToolResult.ok(f"{stdout}\n\n{full_diff}")
+            return ToolResult.ok(stdout)
 
         except FileNotFoundError:
             return ToolResult.fail("Git is not installed")
@@ -213,7 +288,7 @@ class GitLogTool(Tool):
             else:
                 args.extend(["--format=%h %s (%an, %ar)"])
 
-            exit_code, stdout, stderr = await run_git_command(args, cwd=path)
+            exit_code, stdout, stderr = await run_git_command(args, cwd=path, readonly=True)
 
             if exit_code != 0:
                 if "does not have any commits" in stderr:
@@ -262,6 +337,7 @@ class GitBranchTool(Tool):
                 exit_code, stdout, stderr = await run_git_command(
                     ["branch", "-a", "-v"],
                     cwd=path,
+                    readonly=True,
                 )
                 if exit_code != 0:
                     return ToolResult.fail(f"Git error: {stderr}")
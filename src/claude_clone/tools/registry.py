@@ -10,10 +10,12 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._schemas: list[dict[str, Any]] | None = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool instance."""
         self._tools[tool.name] = tool
+        self._schemas = None
 
     def get(self, name: str) -> Tool | None:
         """Get tool by name."""
@@ -24,13 +26,19 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def get_schemas(self) -> list[dict[str, Any]]:
-        """Get all tool schemas for LLM API."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        """Get all tool schemas for LLM API.
+
+        Built once and reused until another tool is registered; callers
+        must not modify the returned list.
+        """
+        if self._schemas is None:
+            self._schemas = [tool.to_schema() for tool in self._tools.values()]
+        return self._schemas
 
     async def execute(self, name: str, arguments: dict[str, Any]) -> ToolResult:
         """Execute a tool with given arguments."""
-        tool = self.get(name)
-        if not tool:
+        tool = self._tools.get(name)
+        if tool is None:
             return ToolResult.fail(f"Unknown tool: {name}")
 
         try:
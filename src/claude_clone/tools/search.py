@@ -2,12 +2,467 @@
 
 import asyncio
 import fnmatch
+import heapq
+import mmap
+import os
 import re
-from pathlib import Path
-from typing import Any
+import shutil
+import stat
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path, PurePath
+from typing import Any, AnyStr
 
 from claude_clone.tools.base import Tool, ToolResult
 
+# Number of files GrepTool reads concurrently in the Python search
+SCAN_BATCH_SIZE = 32
+
+# Directories never searched by GrepTool/GlobTool
+SKIP_DIRS = frozenset(
+    {".git", "node_modules", "__pycache__", ".venv", "venv", ".tox", "dist", "build"}
+)
+
+# ripgrep --glob arguments excluding SKIP_DIRS
+RG_SKIP_ARGS = tuple(arg for skip in sorted(SKIP_DIRS) for arg in ("--glob", f"!{skip}"))
+
+# Files at least this large are mmapped for literal searches
+MMAP_THRESHOLD = 64 * 1024
+
+# Approximate size of the grep result cache, counting the characters of the
+# paths, patterns and matched lines it holds
+SCAN_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Rough per-entry and per-line bookkeeping cost counted against that limit,
+# so files without matches still take up room
+SCAN_CACHE_ENTRY_OVERHEAD = 64
+
+# Files with a NUL byte this close to the start are treated as binary, like grep
+BINARY_SNIFF_BYTES = 4096
+
+# Patterns without any of these can be matched as plain substrings
+REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def literal_needle(pattern: str, case_insensitive: bool) -> str | None:
+    """Return pattern if it can be searched as a plain substring, else None."""
+    if case_insensitive or not pattern or "\n" in pattern:
+        return None
+    if any(c in REGEX_METACHARS for c in pattern):
+        return None
+    return pattern
+
+
+# Line boundaries str.splitlines() honours besides "\n"; the whole-buffer
+# search in iter_matching_lines() only knows about "\n"
+EXTRA_LINE_BREAKS_RE = re.compile("[\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+# The same boundaries as they appear in UTF-8 file bytes ("\r" is folded
+# into "\n" before these are looked for)
+EXTRA_LINE_BREAK_BYTES_RE = re.compile(b"[\v\f\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+# Anchors that mean start/end of the line only when lines are searched one
+# at a time; re.MULTILINE doesn't turn them into per-line anchors
+BUFFER_ANCHOR_RE = re.compile(r"\\[AZ]")
+
+
+def iter_matching_lines(
+    content: AnyStr,
+    regex: re.Pattern[AnyStr] | None,
+    literal: AnyStr | None = None,
+) -> Iterator[tuple[int, AnyStr]]:
+    """Yield (line_number, line) for each line of content that regex matches.
+
+    The regex scans the whole buffer in C instead of being called once per
+    line; it must be compiled with re.MULTILINE so ^ and $ keep their
+    per-line meaning. A match that crosses a newline (e.g. via \\s) is
+    re-checked against its first line alone, matching per-line semantics.
+
+    For str content, patterns using \\A or \\Z and text with line boundaries
+    other than "\\n" fall back to searching each line from str.splitlines().
+
+    When literal is given it is located with find() instead of the regex.
+    Works on str or bytes content; bytes are split on "\\n" only.
+    """
+    if isinstance(content, str) and (
+        (regex is not None and BUFFER_ANCHOR_RE.search(str(regex.pattern)))
+        or EXTRA_LINE_BREAKS_RE.search(content)
+    ):
+        for line_num, line in enumerate(content.splitlines(), 1):
+            if literal is not None:
+                if literal in line:
+                    yield line_num, line
+            else:
+                assert regex is not None
+                if regex.search(line):
+                    yield line_num, line
+        return
+
+    newline = "\n" if isinstance(content, str) else b"\n"
+    pos = 0
+    line_num = 1
+    counted_to = 0
+    # Like splitlines(), a trailing newline doesn't start another line
+    end = len(content)
+    last_start = end if content and not content.endswith(newline) else end - 1
+    while pos <= last_start:
+        if literal is not None:
+            start = content.find(literal, pos)
+            if start == -1:
+                return
+            match_end = start + len(literal)
+        else:
+            assert regex is not None
+            match = regex.search(content, pos)
+            if match is None:
+                return
+            start, match_end = match.span()
+        if start > last_start:
+            return
+        line_num += content.count(newline, counted_to, start)
+        line_start = content.rfind(newline, 0, start) + 1
+        line_end = content.find(newline, start)
+        if line_end == -1:
+            line_end = end
+        counted_to = line_start
+
+        line = content[line_start:line_end]
+        if match_end <= line_end or (regex is not None and regex.search(line)):
+            yield line_num, line
+
+        pos = line_end + 1
+
+
+@lru_cache(maxsize=256)
+def min_match_length(pattern: str, flags: int) -> int:
+    """Return the fewest characters any match of pattern can span.
+
+    Files with fewer bytes than this can't match and are skipped without
+    being opened. Returns 0 if the pattern can't be analysed.
+    """
+    try:
+        # CPython's private regex parser; without it nothing is skipped
+        import re._parser as sre_parse  # type: ignore[import-not-found]
+    except ImportError:
+        return 0
+
+    try:
+        return int(sre_parse.parse(pattern, flags).getwidth()[0])
+    except Exception:
+        return 0
+
+
+def read_searchable(file_path: Path, size: int, needle: bytes | None = None) -> bytes | None:
+    """Return the file's bytes, or None if it looks binary or lacks needle.
+
+    Only the first BINARY_SNIFF_BYTES are read before deciding a file is
+    binary. For literal searches large files are mmapped, so a file without
+    a match is scanned straight from the page cache and never copied into
+    a Python object.
+    """
+    with open(file_path, "rb") as fh:
+        head = fh.read(BINARY_SNIFF_BYTES)
+        if b"\0" in head:
+            return None
+
+        if needle is None or size < MMAP_THRESHOLD:
+            if len(head) < BINARY_SNIFF_BYTES:
+                data = head
+            else:
+                fh.seek(0)
+                data = fh.read()
+            return data if needle is None or needle in data else None
+
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if mm.find(needle) == -1:
+                return None
+            return mm[:]
+
+
+def decode_text(data: bytes) -> str:
+    """Decode file bytes the way read_text(errors="ignore") would, newlines included."""
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# Syntax Python and Hyperscan read differently: Python takes "{,n}" as a
+# repeat, Hyperscan as literal text, so the prefilter would reject matches
+PREFILTER_UNSAFE_RE = re.compile(r"\{\s*,")
+
+
+class HyperscanPrefilter:
+    """Cheap may-match test for a regex, backed by Hyperscan.
+
+    Compiled in prefilter mode, so it can report false positives but not
+    false negatives; text it rejects is never run through Python's regex
+    engine. Each worker thread gets its own scratch space.
+    """
+
+    def __init__(self, hyperscan: Any, database: Any):
+        self._hyperscan = hyperscan
+        self._database = database
+        self._local = threading.local()
+
+    def might_match(self, text: str) -> bool:
+        """Return False only if the regex definitely doesn't match text.
+
+        Pass the decoded, newline-normalised text Python will search, so
+        undecodable bytes and \r\n can't make the two engines disagree.
+        """
+        data = text.encode("utf-8")
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = self._hyperscan.Scratch(self._database)
+        try:
+            self._database.scan(data, match_event_handler=_stop_scan, scratch=scratch)
+        except self._hyperscan.ScanTerminated:
+            return True
+        return False
+
+
+def _stop_scan(*args: Any) -> bool:
+    """Hyperscan match handler that stops at the first match."""
+    return True
+
+
+@lru_cache(maxsize=64)
+def compile_prefilter(pattern: str, case_insensitive: bool) -> HyperscanPrefilter | None:
+    """Compile pattern into a Hyperscan prefilter, or None if unavailable.
+
+    Hyperscan is optional (the "fast" extra); patterns it can't compile or
+    would read differently from Python simply fall back to the plain scan.
+    """
+    # \A and \Z are applied per line, which Hyperscan has no mode for
+    if PREFILTER_UNSAFE_RE.search(pattern) or BUFFER_ANCHOR_RE.search(pattern):
+        return None
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    flags = (
+        hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+        | hyperscan.HS_FLAG_MULTILINE
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_ALLOWEMPTY
+    )
+    if case_insensitive:
+        flags |= hyperscan.HS_FLAG_CASELESS
+
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(expressions=[pattern.encode("utf-8")], ids=[0], flags=[flags])
+    except hyperscan.error:
+        return None
+    return HyperscanPrefilter(hyperscan, database)
+
+
+class ScanCache:
+    """Per-file grep results, reused while a file's mtime and size are unchanged.
+
+    Agents tend to repeat the same searches over a mostly unchanged tree, so
+    this lets later searches skip reading files that were already scanned.
+    Bounded by the bytes it holds rather than its entry count, since one
+    entry can carry anything from no lines to many long ones. Shared by
+    GrepTool's worker threads, hence the lock.
+    """
+
+    def __init__(self, max_bytes: int = SCAN_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[
+            tuple[str, str, int], tuple[int, int, bool, list[tuple[int, str]], int]
+        ] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        key: tuple[str, str, int],
+        st: os.stat_result,
+    ) -> tuple[bool, list[tuple[int, str]]] | None:
+        """Return (complete, matches) for key if the file hasn't changed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            mtime_ns, size, complete, matches, _ = entry
+            if mtime_ns != st.st_mtime_ns or size != st.st_size:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return complete, matches
+
+    def put(
+        self,
+        key: tuple[str, str, int],
+        st: os.stat_result,
+        complete: bool,
+        matches: list[tuple[int, str]],
+    ) -> None:
+        """Store matches for key; complete means they weren't cut off at a limit."""
+        nbytes = (
+            SCAN_CACHE_ENTRY_OVERHEAD
+            + len(key[0])
+            + len(key[1])
+            + sum(SCAN_CACHE_ENTRY_OVERHEAD + len(line) for _, line in matches)
+        )
+        with self._lock:
+            self._remove(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (st.st_mtime_ns, st.st_size, complete, matches, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, path: Path) -> None:
+        """Drop every cached result for path, e.g. after it was written."""
+        name = str(path)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == name]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: tuple[str, str, int]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[4]
+
+
+scan_cache = ScanCache()
+
+
+def scan_file(
+    file_path: Path,
+    regex: re.Pattern[str],
+    limit: int,
+    literal: str | None = None,
+) -> list[tuple[int, str]] | None:
+    """Return up to limit matching (line_number, line) pairs from a file.
+
+    Returns None if the path is not a regular file, and an empty list if it
+    can't be read, looks binary or is too small to match. Safe to call from a worker thread.
+    """
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    if st.st_size < min_match_length(regex.pattern, regex.flags):
+        return []
+
+    # Reuse the previous scan if the file is unchanged since then
+    key = (str(file_path), regex.pattern, regex.flags)
+    cached = scan_cache.get(key, st)
+    if cached is not None:
+        complete, matches = cached
+        if complete or len(matches) >= limit:
+            return matches[:limit]
+
+    try:
+        if literal is not None:
+            # Search the raw bytes and only decode the lines that match
+            needle = literal.encode("utf-8")
+            data = read_searchable(file_path, st.st_size, needle)
+            if data is not None and b"\r" in data:
+                # Break lines exactly as decode_text() does for the regex path
+                data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            if data is None:
+                matches = []
+            elif EXTRA_LINE_BREAK_BYTES_RE.search(data):
+                # Lines break on more than "\n" here; let the str search handle it
+                text = decode_text(data)
+                matches = list(islice(iter_matching_lines(text, None, literal), limit))
+            else:
+                matches = [
+                    (line_num, line.decode("utf-8", errors="ignore"))
+                    for line_num, line in islice(iter_matching_lines(data, None, needle), limit)
+                ]
+        else:
+            data = read_searchable(file_path, st.st_size)
+            prefilter = compile_prefilter(regex.pattern, bool(regex.flags & re.IGNORECASE))
+            content = None if data is None else decode_text(data)
+            if content is not None and EXTRA_LINE_BREAKS_RE.search(content):
+                # Hyperscan's ^ and $ only see "\n" as a line boundary
+                prefilter = None
+            if content is None:
+                matches = []
+            elif prefilter is not None and not prefilter.might_match(content):
+                matches = []
+            else:
+                matches = list(islice(iter_matching_lines(content, regex), limit))
+    except (UnicodeDecodeError, PermissionError):
+        return []
+
+    scan_cache.put(key, st, len(matches) < limit, matches)
+    return matches
+
+
+def display_path(path: Path, cwd: Path) -> str:
+    """Return path relative to cwd when it is inside cwd, else as-is."""
+    try:
+        return str(path.relative_to(cwd))
+    except ValueError:
+        return str(path)
+
+
+def walk_files(root: Path, name_regex: re.Pattern[str] | None = None) -> Iterator[Path]:
+    """Yield files under root, pruning SKIP_DIRS without descending into them.
+
+    Uses os.scandir so file/directory checks come from the directory listing
+    instead of a stat per entry. Like Path.rglob, symlinked directories are
+    not followed. If name_regex is given only matching file names are yielded.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file() and (
+                        name_regex is None or name_regex.match(entry.name)
+                    ):
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str, case_insensitive: bool) -> re.Pattern[str]:
+    """Compile a grep pattern, caching the result across calls.
+
+    MULTILINE keeps per-line ^/$ meaning when whole files are scanned.
+    """
+    flags = re.MULTILINE | (re.IGNORECASE if case_insensitive else 0)
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=1)
+def find_ripgrep() -> str | None:
+    """Locate the ripgrep binary once per process."""
+    return shutil.which("rg")
+
 
 class GrepTool(Tool):
     """Search file contents using regex patterns."""
@@ -28,7 +483,9 @@ class GrepTool(Tool):
         },
         "glob": {
             "type": "string",
-            "description": "Glob pattern to filter files (e.g., '*.py', '*.js'). Default: all files",
+            "description": (
+                "Glob pattern to filter files (e.g., '*.py', '*.js'). Default: all files"
+            ),
         },
         "case_insensitive": {
             "type": "boolean",
@@ -58,12 +515,19 @@ class GrepTool(Tool):
                 return ToolResult.fail(f"Path not found: {path}")
 
             # Compile regex
-            flags = re.IGNORECASE if case_insensitive else 0
             try:
-                regex = re.compile(pattern, flags)
+                regex = compile_pattern(pattern, case_insensitive)
             except re.error as e:
                 return ToolResult.fail(f"Invalid regex pattern: {e}")
 
+            rg = find_ripgrep()
+            if rg:
+                rg_result = await self._search_ripgrep(
+                    rg, pattern, search_path, glob, case_insensitive, max_results
+                )
+                if rg_result is not None:
+                    return rg_result
+
             results = []
             files_searched = 0
             files_matched = 0
@@ -71,45 +535,48 @@ class GrepTool(Tool):
             # Get files to search
             if search_path.is_file():
                 files = [search_path]
+            elif glob and "/" in glob:
+                # Path-style globs need pathlib's segment matching
+                files = [
+                    f for f in search_path.rglob(glob)
+                    if SKIP_DIRS.isdisjoint(f.relative_to(search_path).parts)
+                ]
             else:
-                if glob:
-                    files = list(search_path.rglob(glob))
-                else:
-                    files = [f for f in search_path.rglob("*") if f.is_file()]
-
-            # Filter out common non-text directories
-            skip_dirs = {".git", "node_modules", "__pycache__", ".venv", "venv", ".tox", "dist", "build"}
-            files = [
-                f for f in files
-                if not any(skip in f.parts for skip in skip_dirs)
-            ]
-
-            for file_path in files:
+                name_regex = re.compile(fnmatch.translate(glob)) if glob else None
+                files = list(walk_files(search_path, name_regex))
+
+            # Read and scan files on worker threads a batch at a time so disk
+            # reads overlap, while results stay in file order and we can stop
+            # as soon as max_results is reached
+            cwd = Path.cwd()
+            literal = literal_needle(pattern, case_insensitive)
+            for batch_start in range(0, len(files), SCAN_BATCH_SIZE):
                 if len(results) >= max_results:
                     break
 
-                if not file_path.is_file():
-                    continue
+                batch = files[batch_start:batch_start + SCAN_BATCH_SIZE]
+                remaining = max_results - len(results)
+                scanned = await asyncio.gather(
+                    *(asyncio.to_thread(scan_file, f, regex, remaining, literal) for f in batch)
+                )
 
-                files_searched += 1
+                for file_path, matches in zip(batch, scanned):
+                    if len(results) >= max_results:
+                        break
+                    if matches is None:
+                        continue
 
-                try:
-                    content = file_path.read_text(encoding="utf-8", errors="ignore")
-                    lines = content.splitlines()
-
-                    file_had_match = False
-                    for line_num, line in enumerate(lines, 1):
-                        if len(results) >= max_results:
-                            break
-                        if regex.search(line):
-                            if not file_had_match:
-                                files_matched += 1
-                                file_had_match = True
-                            rel_path = file_path.relative_to(Path.cwd()) if file_path.is_relative_to(Path.cwd()) else file_path
-                            results.append(f"{rel_path}:{line_num}: {line.strip()}")
-
-                except (UnicodeDecodeError, PermissionError):
-                    continue
+                    files_searched += 1
+                    if not matches:
+                        continue
+
+                    files_matched += 1
+                    # Format the path once per file rather than once per line
+                    prefix = display_path(file_path, cwd)
+                    results.extend(
+                        f"{prefix}:{line_num}: {line.strip()}"
+                        for line_num, line in matches[:max_results - len(results)]
+                    )
 
             if not results:
                 return ToolResult.ok(
@@ -119,7 +586,10 @@ class GrepTool(Tool):
 
             output = "\n".join(results)
             if len(results) >= max_results:
-                output += f"\n\n[Results truncated at {max_results}. Use a more specific pattern or glob filter.]"
+                output += (
+                    f"\n\n[Results truncated at {max_results}. "
+                    "Use a more specific pattern or glob filter.]"
+                )
 
             return ToolResult.ok(
                 output,
@@ -131,6 +601,207 @@ class GrepTool(Tool):
         except Exception as e:
             return ToolResult.fail(f"Search error: {str(e)}")
 
+    async def _search_ripgrep(
+        self,
+        rg: str,
+        pattern: str,
+        search_path: Path,
+        glob: str | None,
+        case_insensitive: bool,
+        max_results: int,
+    ) -> ToolResult | None:
+        """Search with ripgrep, returning None if the Python search should run instead.
+
+        Hidden and gitignored files are searched so results match the Python
+        fallback; only SKIP_DIRS are excluded.
+        """
+        cwd = Path.cwd()
+        args = [
+            rg,
+            "--line-number",
+            "--with-filename",
+            "--no-heading",
+            "--color=never",
+            "--null",
+            "--hidden",
+            "--no-ignore",
+            "--no-messages",
+            # Keep minified files from producing megabyte-long lines
+            "--max-columns=1000",
+            "--max-columns-preview",
+        ]
+        if case_insensitive:
+            args.append("--ignore-case")
+        if glob:
+            args.extend(["--glob", glob])
+        args.extend(RG_SKIP_ARGS)
+        args.extend(["--regexp", pattern])
+
+        # Search relative to cwd so rg prints the same paths as the fallback
+        if search_path != cwd:
+            args.append(
+                str(search_path.relative_to(cwd))
+                if search_path.is_relative_to(cwd)
+                else str(search_path)
+            )
+
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=cwd,
+        )
+        assert process.stdout is not None
+
+        results = []
+        matched_files = set()
+        async for raw in process.stdout:
+            # --null separates the path from "line:text" with a NUL byte
+            file_part, _, rest = raw.decode("utf-8", errors="replace").partition("\0")
+            line_num, _, line = rest.partition(":")
+            matched_files.add(file_part)
+            results.append(f"{file_part}:{line_num}: {line.strip()}")
+            if len(results) >= max_results:
+                # rg has often finished by now; see run_git_command_capped()
+                if process.returncode is None:
+                    try:
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                break
+        await process.wait()
+
+        # Exit code 2 means rg couldn't handle the pattern (e.g. lookaround);
+        # let the Python regex engine take over
+        if not results and process.returncode == 2:
+            return None
+
+        if not results:
+            return ToolResult.ok(f"No matches found for pattern '{pattern}'.")
+
+        output = "\n".join(results)
+        if len(results) >= max_results:
+            output += (
+                f"\n\n[Results truncated at {max_results}. "
+                "Use a more specific pattern or glob filter.]"
+            )
+
+        return ToolResult.ok(
+            output,
+            matches=len(results),
+            files_matched=len(matched_files),
+        )
+
+
+# A compiled glob segment: literal name, name regex, or None for "**"
+GlobSegment = str | re.Pattern[str] | None
+
+
+@lru_cache(maxsize=64)
+def compile_glob(pattern: str) -> tuple[GlobSegment, ...]:
+    """Compile a relative glob pattern into per-directory-level matchers.
+
+    Follows Path.glob's rules: "**" must be a whole component and matches
+    any number of directories, a trailing separator matches only
+    directories, and a pattern is relative to its base.
+    """
+    if not pattern:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+    pure = PurePath(pattern)
+    if pure.anchor:
+        raise NotImplementedError("Non-relative patterns are unsupported")
+
+    segments: list[GlobSegment] = []
+    for part in pure.parts:
+        if part == "**":
+            segments.append(None)
+        elif "**" in part:
+            raise ValueError("Invalid pattern: '**' can only be an entire path component")
+        elif "*" in part or "?" in part or "[" in part:
+            segments.append(re.compile(fnmatch.translate(part)))
+        else:
+            segments.append(part)
+    if pattern.endswith(("/", os.sep)):
+        # An empty last segment joins to "dir/", which only exists for directories
+        segments.append("")
+    return tuple(segments)
+
+
+def iter_subdirs(root: str) -> Iterator[str]:
+    """Yield root and every directory below it, pruning SKIP_DIRS and symlinks."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        yield directory
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def iter_glob(base: str, segments: tuple[GlobSegment, ...], index: int = 0) -> Iterator[str]:
+    """Yield paths under base matching segments[index:].
+
+    Each directory level is matched against its own segment, so subtrees
+    whose names don't match are never listed. Names in SKIP_DIRS are never
+    matched. May yield a path more than once for patterns with several "**".
+    """
+    if index == len(segments):
+        yield base
+        return
+
+    segment = segments[index]
+    last = index == len(segments) - 1
+
+    if segment is None:
+        for directory in iter_subdirs(base):
+            yield from iter_glob(directory, segments, index + 1)
+    elif isinstance(segment, str):
+        # Literal names need a single lookup, not a directory listing
+        if segment in SKIP_DIRS:
+            return
+        path = os.path.join(base, segment)
+        if last:
+            if os.path.lexists(path):
+                yield path
+        elif os.path.isdir(path):
+            yield from iter_glob(path, segments, index + 1)
+    else:
+        try:
+            with os.scandir(base) as it:
+                entries = [e for e in it if e.name not in SKIP_DIRS and segment.match(e.name)]
+        except OSError:
+            return
+        for entry in entries:
+            if last:
+                yield entry.path
+            else:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    yield from iter_glob(entry.path, segments, index + 1)
+
+
+def glob_entry(path: Path) -> tuple[float, Path, bool]:
+    """Return (mtime, path, is_dir) for a glob match from a single stat.
+
+    Matches that can't be stat'ed (e.g. broken symlinks) sort as oldest.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return 0.0, path, False
+    return st.st_mtime, path, stat.S_ISDIR(st.st_mode)
+
 
 class GlobTool(Tool):
     """Find files matching glob patterns."""
@@ -173,46 +844,38 @@ class GlobTool(Tool):
             if not base_path.is_dir():
                 return ToolResult.fail(f"Not a directory: {path}")
 
-            # Find matching files
-            matches = list(base_path.glob(pattern))
-
-            # Filter out common skip directories
-            skip_dirs = {".git", "node_modules", "__pycache__", ".venv", "venv", ".tox", "dist", "build"}
-            matches = [
-                m for m in matches
-                if not any(skip in m.parts for skip in skip_dirs)
-            ]
+            # Find matching files; dict.fromkeys drops repeats from multiple "**"
+            segments = compile_glob(pattern)
+            matches = [Path(m) for m in dict.fromkeys(iter_glob(str(base_path), segments))]
 
-            # Sort by modification time (newest first)
-            matches.sort(key=lambda p: p.stat().st_mtime if p.exists() else 0, reverse=True)
-
-            # Apply limit
+            # Keep only the newest max_results, statting each match once
             truncated = len(matches) > max_results
-            matches = matches[:max_results]
+            newest = heapq.nlargest(
+                max_results,
+                (glob_entry(match) for match in matches),
+                key=lambda entry: entry[0],
+            )
 
-            if not matches:
+            if not newest:
                 return ToolResult.ok(
                     f"No files found matching pattern '{pattern}'",
                     count=0,
                 )
 
             # Format output with relative paths
-            lines = []
-            for match in matches:
-                try:
-                    rel_path = match.relative_to(Path.cwd()) if match.is_relative_to(Path.cwd()) else match
-                    file_type = "d" if match.is_dir() else "f"
-                    lines.append(f"[{file_type}] {rel_path}")
-                except Exception:
-                    lines.append(f"[?] {match}")
+            cwd = Path.cwd()
+            lines = [
+                f"[{'d' if is_dir else 'f'}] {display_path(match, cwd)}"
+                for _, match, is_dir in newest
+            ]
 
             output = "\n".join(lines)
             if truncated:
-                output += f"\n\n[Results truncated. {len(matches)} of many matches shown.]"
+                output += f"\n\n[Results truncated. {len(newest)} of many matches shown.]"
 
             return ToolResult.ok(
                 output,
-                count=len(matches),
+                count=len(newest),
                 truncated=truncated,
             )
 
@@ -39,6 +39,10 @@ DANGEROUS_COMMANDS = [
     r"sudo\s",
 ]
 
+# Each list fused into one alternation so a command is scanned once, not per pattern
+BLOCKED_RE = re.compile("|".join(f"(?:{p})" for p in BLOCKED_COMMANDS), re.IGNORECASE)
+DANGEROUS_RE = re.compile("|".join(f"(?:{p})" for p in DANGEROUS_COMMANDS), re.IGNORECASE)
+
 
 class BashTool(Tool):
     """Execute shell commands."""
@@ -66,17 +70,11 @@ class BashTool(Tool):
 
     def _is_blocked(self, command: str) -> bool:
         """Check if command matches blocked patterns."""
-        for pattern in BLOCKED_COMMANDS:
-            if re.search(pattern, command, re.IGNORECASE):
-                return True
-        return False
+        return BLOCKED_RE.search(command) is not None
 
     def _is_dangerous(self, command: str) -> bool:
         """Check if command requires extra caution."""
-        for pattern in DANGEROUS_COMMANDS:
-            if re.search(pattern, command, re.IGNORECASE):
-                return True
-        return False
+        return DANGEROUS_RE.search(command) is not None
 
     async def execute(
         self,
@@ -5,8 +5,15 @@ from typing import Any, Literal
 
 from claude_clone.tools.base import Tool, ToolResult
 
+# Checkbox shown for each todo status
+STATUS_ICONS = {
+    "pending": "[ ]",
+    "in_progress": "[>]",
+    "completed": "[x]",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class TodoItem:
     """A single todo item."""
 
@@ -19,15 +26,18 @@ class TodoManager:
     """Singleton manager for todo items across the session.
 
     This allows the LLM to track progress on multi-step tasks
-    and provides visibility to the user.
+    and provides visibility to the user. Counts and the active item are
+    computed once per update() rather than on every query.
     """
 
+    __slots__ = ("todos", "_active", "_pending", "_completed")
+
     _instance: "TodoManager | None" = None
 
     def __new__(cls) -> "TodoManager":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance.todos: list[TodoItem] = []
+            cls._instance.update([])
         return cls._instance
 
     @classmethod
@@ -38,6 +48,16 @@ class TodoManager:
     def update(self, todos: list[TodoItem]) -> None:
         """Replace the entire todo list."""
         self.todos = todos
+        self._active: TodoItem | None = None
+        self._pending = 0
+        self._completed = 0
+        for todo in todos:
+            if todo.status == "pending":
+                self._pending += 1
+            elif todo.status == "completed":
+                self._completed += 1
+            elif todo.status == "in_progress" and self._active is None:
+                self._active = todo
 
     def get_todos(self) -> list[TodoItem]:
         """Get all todos."""
@@ -45,33 +65,22 @@ class TodoManager:
 
     def get_active(self) -> TodoItem | None:
         """Get the currently in-progress item (should only be one)."""
-        for todo in self.todos:
-            if todo.status == "in_progress":
-                return todo
-        return None
+        return self._active
 
     def get_pending_count(self) -> int:
         """Get count of pending items."""
-        return sum(1 for t in self.todos if t.status == "pending")
+        return self._pending
 
     def get_completed_count(self) -> int:
         """Get count of completed items."""
-        return sum(1 for t in self.todos if t.status == "completed")
+        return self._completed
 
     def format_display(self) -> str:
         """Format todos for display."""
         if not self.todos:
             return ""
 
-        lines = []
-        for todo in self.todos:
-            icon = {
-                "pending": "[ ]",
-                "in_progress": "[>]",
-                "completed": "[x]",
-            }[todo.status]
-            lines.append(f"{icon} {todo.content}")
-        return "\n".join(lines)
+        return "\n".join(f"{STATUS_ICONS[todo.status]} {todo.content}" for todo in self.todos)
 
 
 class TodoWriteTool(Tool):
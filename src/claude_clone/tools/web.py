@@ -1,12 +1,276 @@
 """Web search and fetch tools."""
 
 import asyncio
+import importlib.util
+import io
+import json
+import re
+import sqlite3
+import threading
+import time
 import warnings
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
 from typing import Any
 
+import httpx
+
 from claude_clone.tools.base import Tool, ToolResult
 
 
+# Runs of whitespace collapsed to a single space in fetched page text
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Decoded characters read from the response per chunk while fetching
+FETCH_CHUNK_SIZE = 16384
+
+# Seconds a cached search/fetch result is reused without touching the network
+WEB_CACHE_TTL = 3600
+
+# Seconds after which cached results are deleted, even if they could be revalidated
+WEB_CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+class TextCollector:
+    """Accumulates visible page text from parser events, skipping page chrome.
+
+    Implements lxml's parser target interface (start/end/data/comment/close)
+    and is also driven by TextExtractor. Text is whitespace-collapsed as each
+    node completes, so total_chars is the length get_text() will return and
+    callers can stop feeding once they have enough.
+    """
+
+    skip_tags = {"script", "style", "nav", "footer", "header", "aside"}
+
+    def __init__(self) -> None:
+        # One growing buffer rather than a list of every fragment
+        self._text = io.StringIO()
+        self.total_chars = 0
+        self.current_skip = 0
+        # A text node can arrive in pieces when it spans two chunks
+        self._pending: list[str] = []
+
+    def start(self, tag: str, attrib: Any = None) -> None:
+        self._flush()
+        if tag in self.skip_tags:
+            self.current_skip += 1
+
+    def end(self, tag: str) -> None:
+        self._flush()
+        if tag in self.skip_tags and self.current_skip > 0:
+            self.current_skip -= 1
+
+    def comment(self, text: str) -> None:
+        self._flush()
+
+    def data(self, data: str) -> None:
+        if self.current_skip == 0:
+            self._pending.append(data)
+
+    def close(self) -> str:
+        return self.get_text()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        text = WHITESPACE_RE.sub(" ", "".join(self._pending)).strip()
+        self._pending.clear()
+        if text:
+            if self.total_chars:
+                self._text.write(" ")
+                self.total_chars += 1
+            self._text.write(text)
+            self.total_chars += len(text)
+
+    def get_text(self) -> str:
+        self._flush()
+        return self._text.getvalue()
+
+
+class TextExtractor(HTMLParser):
+    """Pure-Python HTML text extractor, used when lxml is not installed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.collector = TextCollector()
+
+    @property
+    def total_chars(self) -> int:
+        return self.collector.total_chars
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.collector.start(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self.collector.end(tag)
+
+    def handle_comment(self, data: str) -> None:
+        self.collector.comment(data)
+
+    def handle_data(self, data: str) -> None:
+        self.collector.data(data)
+
+    def get_text(self) -> str:
+        return self.collector.get_text()
+
+
+class LxmlTextExtractor:
+    """HTML text extractor that tokenizes with lxml's C parser.
+
+    Same feed()/total_chars/get_text() interface as TextExtractor.
+    """
+
+    def __init__(self) -> None:
+        from lxml import etree  # type: ignore[import-untyped]
+
+        self.collector = TextCollector()
+        self._parser = etree.HTMLParser(target=self.collector)
+        self._closed = False
+
+    @property
+    def total_chars(self) -> int:
+        return self.collector.total_chars
+
+    def feed(self, data: str) -> None:
+        self._parser.feed(data)
+
+    def get_text(self) -> str:
+        # Closing flushes lxml's buffered input; it can only be done once
+        if not self._closed:
+            self._parser.close()
+            self._closed = True
+        return self.collector.get_text()
+
+
+def make_text_extractor() -> TextExtractor | LxmlTextExtractor:
+    """Return an lxml-backed extractor if lxml is installed, else the Python one."""
+    try:
+        return LxmlTextExtractor()
+    except ImportError:
+        return TextExtractor()
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached web tool result."""
+
+    value: Any
+    etag: str | None
+    fresh: bool  # Younger than the cache TTL
+
+
+class WebCache:
+    """SQLite-backed cache for web_search/web_fetch results.
+
+    Entries younger than ttl are served directly. Older fetch results that
+    came with an ETag are kept so the next fetch can send If-None-Match and
+    reuse them on a 304. Cache errors are treated as misses so a broken
+    cache file never breaks the tools.
+    """
+
+    def __init__(self, path: Path | None = None, ttl: float = WEB_CACHE_TTL):
+        self.path = path or Path.home() / ".claude-clone" / "web_cache.sqlite3"
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, etag TEXT, stored_at REAL NOT NULL)"
+            )
+            expired_before = time.time() - WEB_CACHE_MAX_AGE
+            conn.execute("DELETE FROM cache WHERE stored_at < ?", (expired_before,))
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a cache key from the tool name and its arguments."""
+        return json.dumps(parts)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry for key, or None if there isn't one."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT value, etag, stored_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return None
+
+            value, etag, stored_at = row
+            fresh = time.time() - stored_at < self.ttl
+            if not fresh and etag is None:
+                return None
+            return CacheEntry(json.loads(value), etag, fresh)
+        except (sqlite3.Error, OSError, ValueError):
+            # Unwritable cache directory or a corrupt row
+            return None
+
+    def set(self, key: str, value: Any, etag: str | None = None) -> None:
+        """Store value under key, stamped with the current time."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, etag, stored_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), etag, time.time()),
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError, ValueError):
+            pass
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+web_cache = WebCache()
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient for web_fetch, creating it on first use.
+
+    Reusing one client keeps connections (and their TLS sessions) alive
+    between fetches. A client is tied to the event loop that created it,
+    so a new one is made if called from a different loop.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=30.0,
+            headers={"User-Agent": "Mozilla/5.0 (compatible; SkyNet/1.0)"},
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared web_fetch client, if one was created."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        client, _http_client, _http_client_loop = _http_client, None, None
+        await client.aclose()
+
+
 class WebSearchTool(Tool):
     """Search the web using DuckDuckGo."""
 
@@ -34,6 +298,13 @@ class WebSearchTool(Tool):
         **kwargs: Any,
     ) -> ToolResult:
         """Search the web and return results."""
+        # Agents often repeat the same query within a session
+        cache_key = WebCache.make_key("web_search", query, max_results)
+        cached = web_cache.get(cache_key)
+        if cached is not None and cached.fresh:
+            output, result_count = cached.value
+            return ToolResult.ok(output, result_count=result_count)
+
         try:
             # Run the synchronous DuckDuckGo search in a thread pool
             loop = asyncio.get_event_loop()
@@ -61,7 +332,9 @@ class WebSearchTool(Tool):
                     output_lines.append(f"   {snippet[:300]}")
                 output_lines.append("")
 
-            return ToolResult.ok("\n".join(output_lines), result_count=len(results))
+            output = "\n".join(output_lines)
+            web_cache.set(cache_key, [output, len(results)])
+            return ToolResult.ok(output, result_count=len(results))
 
         except Exception as e:
             return ToolResult.fail(f"Search error: {str(e)}")
@@ -111,54 +384,36 @@ class WebFetchTool(Tool):
         **kwargs: Any,
     ) -> ToolResult:
         """Fetch and extract text from a URL."""
+        cache_key = WebCache.make_key("web_fetch", url, max_length)
+        cached = web_cache.get(cache_key)
+        if cached is not None and cached.fresh:
+            return ToolResult.ok(cached.value, url=url)
+
         try:
-            import httpx
-            from html.parser import HTMLParser
-
-            # Simple HTML text extractor
-            class TextExtractor(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.text_parts = []
-                    self.skip_tags = {"script", "style", "nav", "footer", "header", "aside"}
-                    self.current_skip = 0
-
-                def handle_starttag(self, tag, attrs):
-                    if tag in self.skip_tags:
-                        self.current_skip += 1
-
-                def handle_endtag(self, tag):
-                    if tag in self.skip_tags and self.current_skip > 0:
-                        self.current_skip -= 1
-
-                def handle_data(self, data):
-                    if self.current_skip == 0:
-                        text = data.strip()
-                        if text:
-                            self.text_parts.append(text)
-
-                def get_text(self) -> str:
-                    return " ".join(self.text_parts)
-
-            # Fetch the URL with httpx (async)
-            async with httpx.AsyncClient(
-                follow_redirects=True,
-                timeout=30.0,
-                headers={"User-Agent": "Mozilla/5.0 (compatible; SkyNet/1.0)"}
-            ) as client:
-                response = await client.get(url)
+            # Fetch the URL with httpx (async), parsing the body as it streams in
+            extractor = make_text_extractor()
+            client = get_http_client()
+
+            # Revalidate a stale cached copy instead of downloading it again
+            headers: dict[str, str] = {}
+            if cached is not None and cached.etag:
+                headers["If-None-Match"] = cached.etag
+
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and cached is not None:
+                    web_cache.set(cache_key, cached.value, cached.etag)
+                    return ToolResult.ok(cached.value, url=url)
+
                 response.raise_for_status()
-                html = response.text
+                etag = response.headers.get("etag")
+                async for chunk in response.aiter_text(FETCH_CHUNK_SIZE):
+                    extractor.feed(chunk)
+                    # Anything past max_length would be truncated anyway
+                    if extractor.total_chars > max_length:
+                        break
 
-            # Extract text
-            extractor = TextExtractor()
-            extractor.feed(html)
             text = extractor.get_text()
 
-            # Clean up whitespace
-            import re
-            text = re.sub(r'\s+', ' ', text).strip()
-
             # Truncate if needed
             if len(text) > max_length:
                 text = text[:max_length] + "\n\n[Content truncated...]"
@@ -166,7 +421,9 @@ class WebFetchTool(Tool):
             if not text.strip():
                 return ToolResult.fail("Could not extract text content from the page")
 
-            return ToolResult.ok(f"Content from {url}:\n\n{text}", url=url)
+            output = f"Content from {url}:\n\n{text}"
+            web_cache.set(cache_key, output, etag)
+            return ToolResult.ok(output, url=url)
 
         except httpx.HTTPStatusError as e:
             return ToolResult.fail(f"HTTP error {e.response.status_code}: {url}")
@@ -1,7 +1,13 @@
 """Rich console wrapper for terminal output."""
 
+import os
+import re
+import reprlib
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import Completer, Completion
@@ -9,16 +15,18 @@ from prompt_toolkit.history import FileHistory
 from prompt_toolkit.formatted_text import FormattedText
 from rich.console import Console
 from rich.live import Live
-from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.spinner import Spinner
-from rich.syntax import Syntax
 from rich.text import Text
 
 from claude_clone.config import settings, permission_mode_manager
 from claude_clone.core.interrupt import interrupt_controller
 from claude_clone.ui.keybindings import KeyBindingManager
 
+if TYPE_CHECKING:
+    # Imported where used at runtime to keep startup fast (markdown-it is slow to load)
+    from rich.markdown import Markdown
+    from rich.spinner import Spinner
+
 
 # Slash commands with descriptions
 SLASH_COMMANDS = {
@@ -40,67 +48,252 @@ SLASH_COMMANDS = {
 }
 
 
-class SlashCommandCompleter(Completer):
-    """Autocomplete for slash commands."""
+# Precomputed (filled, empty) cells for context usage bars, indexed by filled count
+STATUS_BAR_CELLS = [("█" * i, "░" * (10 - i)) for i in range(11)]
+CONTEXT_BAR_CELLS = [("█" * i, "░" * (30 - i)) for i in range(31)]
 
-    def get_completions(self, document, complete_event):
-        text = document.text_before_cursor
 
-        # Only complete if starting with /
-        if not text.startswith("/"):
+def _build_completions(commands: dict[str, str]) -> dict[str, tuple[Completion, ...]]:
+    """Map every prefix of every command to ready-made completions.
+
+    A completion's start_position only depends on the typed text, so each
+    prefix's Completion objects can be built once and reused.
+    """
+    index: dict[str, list[Completion]] = {}
+    for cmd, description in commands.items():
+        for end in range(1, len(cmd) + 1):
+            index.setdefault(cmd[:end], []).append(
+                Completion(cmd, start_position=-end, display_meta=description)
+            )
+    return {prefix: tuple(completions) for prefix, completions in index.items()}
+
+
+# Rich color names used by PermissionModeManager -> prompt_toolkit style names
+COLOR_TO_ANSI = {"green": "ansigreen", "yellow": "ansiyellow", "cyan": "ansicyan"}
+
+# Typed text -> its slash command completions, so completing is a single lookup
+SLASH_COMMAND_COMPLETIONS = _build_completions(SLASH_COMMANDS)
+
+
+# Terminal mode 2026: frames between these are presented atomically, without tearing
+SYNC_OUTPUT_BEGIN = "\x1b[?2026h"
+SYNC_OUTPUT_END = "\x1b[?2026l"
+
+# $TERM_PROGRAM / $TERM values of terminals known to support synchronized output
+SYNC_OUTPUT_TERM_PROGRAMS = frozenset({"iTerm.app", "WezTerm", "vscode", "ghostty", "contour"})
+SYNC_OUTPUT_TERMS = frozenset({"xterm-kitty", "foot", "alacritty", "xterm-ghostty", "wezterm"})
+
+
+def supports_synchronized_output(env: Mapping[str, str] | None = None) -> bool:
+    """Guess from the environment whether the terminal supports mode 2026."""
+    environ: Mapping[str, str] = os.environ if env is None else env
+    return (
+        environ.get("TERM_PROGRAM") in SYNC_OUTPUT_TERM_PROGRAMS
+        or environ.get("TERM") in SYNC_OUTPUT_TERMS
+        or "WT_SESSION" in environ  # Windows Terminal
+    )
+
+
+# Timestamp format used in the session list
+SESSION_TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Longest tool argument shown in a tool call line
+TOOL_ARG_DISPLAY_CHARS = 50
+
+
+def short_arg(value: Any, limit: int = TOOL_ARG_DISPLAY_CHARS) -> str:
+    """Shorten a tool argument for display, without formatting all of a huge value."""
+    if isinstance(value, str):
+        text = value[: limit + 1]
+    else:
+        # reprlib caps the size of nested containers and long strings as it goes
+        text = reprlib.repr(value)[: limit + 1]
+    if len(text) > limit:
+        return text[: limit - 3] + "..."
+    return text
+
+
+def format_session_time(updated_at: str | None) -> str:
+    """Format an ISO timestamp as "YYYY-MM-DD HH:MM" for the session list."""
+    if not updated_at:
+        return "unknown"
+    # Sessions store datetime.isoformat() output, which can be sliced directly
+    if (
+        len(updated_at) >= 16
+        and updated_at[4] == updated_at[7] == "-"
+        and updated_at[10] == "T"
+        and updated_at[13] == ":"
+    ):
+        return updated_at[:10] + " " + updated_at[11:16]
+    # Only values starting with a year are worth handing to fromisoformat()
+    if updated_at[:4].isdigit():
+        try:
+            return datetime.fromisoformat(updated_at).strftime(SESSION_TIME_FORMAT)
+        except ValueError:
+            pass
+    return updated_at[:16]
+
+
+class SyncedLive(Live):
+    """Live display that can wrap each refresh in synchronized output markers."""
+
+    def __init__(self, *args: Any, sync_output: bool = False, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.sync_output = sync_output
+
+    def refresh(self) -> None:
+        if not (self.sync_output and self.console.is_terminal):
+            super().refresh()
             return
+        with self._lock:
+            self.console.file.write(SYNC_OUTPUT_BEGIN)
+            try:
+                super().refresh()
+            finally:
+                self.console.file.write(SYNC_OUTPUT_END)
+                self.console.file.flush()
 
-        # Find matching commands
-        for cmd, description in SLASH_COMMANDS.items():
-            if cmd.startswith(text):
-                yield Completion(
-                    cmd,
-                    start_position=-len(text),
-                    display_meta=description,
-                )
+
+# Refresh rate of the spinner/streaming Live display
+LIVE_REFRESH_PER_SECOND = 10
+
+# Parsed Markdown kept for the most recently printed messages
+MARKDOWN_CACHE_SIZE = 16
+
+# Texts shorter than this are parsed every time instead of cached
+MARKDOWN_CACHE_MIN_CHARS = 256
+
+# Replies up to this length with no Markdown syntax skip the Markdown parser
+PLAIN_REPLY_MAX_CHARS = 200
+
+# Characters and line starts that Markdown would render differently from plain text
+MARKDOWN_SYNTAX_RE = re.compile(r"[`#*_\[\]>\n<&|~\\]|^\s*(?:[-+]|\d+[.)])")
+
+# Longest tool output shown under a tool call; the model still gets all of it
+TOOL_RESULT_DISPLAY_CHARS = 2000
+
+# Streamed text held back before it is written out without a newline
+STREAM_FLUSH_CHARS = 4096
+
+# Last line of the welcome panel
+WELCOME_HINT = Text("Type your message and press Enter. Use Ctrl+C to exit.", style="dim")
+
+# Panel titles, parsed from markup once at import instead of on every render
+ASSISTANT_TITLE = Text.from_markup("[bold red]SkyNet[/bold red]")
+USER_TITLE = Text.from_markup("[bold blue]You[/bold blue]")
+THINKING_TITLE = Text.from_markup("[dim]Thinking...[/dim]")
+
+# Longest message text laid out by Rich; the rest is summarized
+MAX_RENDER_CHARS = 50_000
+
+
+def is_plain_reply(content: str) -> bool:
+    """Return True if content is short and renders the same without Markdown."""
+    return len(content) <= PLAIN_REPLY_MAX_CHARS and not MARKDOWN_SYNTAX_RE.search(content)
+
+
+def truncate_for_render(content: str, limit: int = MAX_RENDER_CHARS) -> str:
+    """Cut content to limit characters, noting how much was left out."""
+    if len(content) <= limit:
+        return content
+    hidden = len(content) - limit
+    return f"{content[:limit]}\n…[{hidden:,} more chars]"
+
+
+class SlashCommandCompleter(Completer):
+    """Autocomplete for slash commands."""
+
+    def get_completions(self, document, complete_event):
+        # Only text starting with / has completions
+        return iter(SLASH_COMMAND_COMPLETIONS.get(document.text_before_cursor, ()))
 
 
 class StreamingPanel:
-    """Manages a Rich panel that updates during streaming."""
+    """Manages a Rich panel that updates during streaming.
 
-    def __init__(self, console: Console, title: str = "SkyNet"):
+    Chunks are only recorded as they arrive; the panel is its own Live
+    renderable (via __rich__), so Live renders it on its refresh tick and
+    the render cost is bounded by the refresh rate rather than the token
+    rate.
+    """
+
+    def __init__(self, console: Console, title: str = "SkyNet", sync_output: bool = False):
         self.console = console
         self.title = title
-        self.content = ""
+        # Parsed once rather than on every refresh tick
+        self._title_text = Text.from_markup(f"[bold red]{title}[/bold red]")
+        self.sync_output = sync_output
+        self._parts: list[str] = []
+        # (number of parts joined, joined text), reused until more parts arrive
+        self._joined: tuple[int, str] = (0, "")
+        # Set by finish() to the panel left on screen once streaming ends
+        self._final: Panel | None = None
         self.live: Live | None = None
 
+    @property
+    def content(self) -> str:
+        """Text streamed so far."""
+        # Read the count first: the join may include later parts, never fewer
+        count = len(self._parts)
+        if self._joined[0] != count:
+            self._joined = (count, "".join(self._parts))
+        return self._joined[1]
+
     def _render(self) -> Panel:
         """Render current content as a panel."""
+        if self._final is not None:
+            return self._final
+
         # Show cursor during streaming
         display_content = self.content + "▌" if self.content else "▌"
         return Panel(
             Text(display_content),
-            title=f"[bold red]{self.title}[/bold red]",
+            title=self._title_text,
             border_style="red",
             padding=(0, 1),
         )
 
-    def start(self) -> None:
-        """Begin streaming output."""
-        self.content = ""
+    def __rich__(self) -> Panel:
+        return self._render()
+
+    def start(self, live: SyncedLive | None = None) -> None:
+        """Begin streaming output.
+
+        Pass the spinner's running Live to take it over instead of stopping
+        it and starting another refresh thread.
+        """
+        self._parts = []
+        self._joined = (0, "")
+        self._final = None
         self.console.print()  # Newline before panel
-        self.live = Live(
-            self._render(),
+        if live is not None:
+            self.live = live
+            live.update(self, refresh=True)
+            return
+        self.live = SyncedLive(
+            self,
             console=self.console,
-            refresh_per_second=10,
-            transient=True,  # Remove when done so we can render final markdown
+            refresh_per_second=LIVE_REFRESH_PER_SECOND,
+            transient=True,  # Erased on finish() unless a final panel replaces it
+            sync_output=self.sync_output,
         )
         self.live.start()
 
     def append(self, chunk: str) -> None:
-        """Append content and refresh display."""
-        self.content += chunk
-        if self.live:
-            self.live.update(self._render())
+        """Append content; the next Live refresh picks it up."""
+        self._parts.append(chunk)
 
-    def finish(self) -> Panel:
-        """Complete streaming, return final content for markdown rendering."""
+    def finish(self, final: Panel | None = None) -> str:
+        """Complete streaming and return the streamed content.
+
+        If final is given, Live's closing refresh draws it in place of the
+        streaming panel and leaves it on screen, so the finished message is
+        written once. Otherwise the streaming panel is erased.
+        """
         if self.live:
+            if final is not None:
+                self._final = final
+                self.live.transient = False
             self.live.stop()
             self.live = None
         return self.content
@@ -109,40 +302,57 @@ class StreamingPanel:
 class StatusSpinner:
     """Displays a spinner with status message."""
 
-    def __init__(self, console: Console):
+    def __init__(self, console: Console, sync_output: bool = False):
         self.console = console
-        self.live: Live | None = None
+        self.sync_output = sync_output
+        self.live: SyncedLive | None = None
+        self._spinner: Spinner | None = None
+        # Shared by every spinner this instance shows; updates edit it in place
+        self._text = Text("", style="dim")
         self.message = ""
 
-    def _render(self) -> Text:
-        """Render spinner with message."""
-        return Text.assemble(
-            ("⠋ ", "cyan"),
-            (self.message, "dim"),
-        )
+    def _build_spinner(self, message: str) -> "Spinner":
+        """Build the spinner renderable for message."""
+        from rich.spinner import Spinner
+
+        self._text.plain = message
+        return Spinner("dots", text=self._text)
 
     def start(self, message: str) -> None:
-        """Start spinner with message."""
+        """Start spinner with message, reusing the display if already running."""
+        if self.live:
+            self.update(message)
+            return
         self.message = message
-        self.live = Live(
-            Spinner("dots", text=Text(message, style="dim")),
+        self._spinner = self._build_spinner(message)
+        self.live = SyncedLive(
+            self._spinner,
             console=self.console,
-            refresh_per_second=10,
+            refresh_per_second=LIVE_REFRESH_PER_SECOND,
             transient=True,
+            sync_output=self.sync_output,
         )
         self.live.start()
 
     def update(self, message: str) -> None:
         """Update spinner message."""
         self.message = message
-        if self.live:
-            self.live.update(Spinner("dots", text=Text(message, style="dim")))
+        if self.live and self._spinner:
+            # Picked up by the Live's next auto refresh
+            self._text.plain = message
 
     def stop(self) -> None:
         """Stop the spinner."""
         if self.live:
             self.live.stop()
             self.live = None
+        self._spinner = None
+
+    def hand_off(self) -> SyncedLive | None:
+        """Give up the running Live, still started, for another display to reuse."""
+        live, self.live = self.live, None
+        self._spinner = None
+        return live
 
 
 class ChatConsole:
@@ -154,18 +364,39 @@ class ChatConsole:
         self._status_spinner: StatusSpinner | None = None
         self._completer = SlashCommandCompleter()
         self._prompt_session: PromptSession | None = None
+        self._supports_sync_output = supports_synchronized_output()
+        # Piped or redirected: streamed text skips Rich's render pipeline
+        self._plain_output = not self.console.is_terminal
 
         # Status line data
         self._status_data: dict[str, Any] = {
             "context_used": 0,
             "context_max": settings.num_ctx,
             "model": settings.model,
-            "session_start": datetime.now(),
+            # Monotonic, so the clock is a float subtraction per keystroke
+            "session_start": time.monotonic(),
         }
 
+        # Cached status bar fragments, see _get_status_bar()
+        self._status_bar_key: tuple[Any, ...] | None = None
+        self._cached_mode_info: tuple[Any, str, str] | None = None
+        self._status_bar_static: list[tuple[str, str]] = []
+        self._status_bar_elapsed = -1
+        self._status_bar_time: list[tuple[str, str]] = []
+
         # Thinking display toggle
         self._show_thinking = True
 
+        # Parsed Markdown by source text, see _get_markdown()
+        self._markdown_cache: OrderedDict[str, Markdown] = OrderedDict()
+
+        # Fragments of the line being built with write(), printed by writeln()
+        self._line_buffer: list[str | Text] = []
+
+        # Streaming chunks not yet written, see print_streaming_chunk()
+        self._stream_buffer: list[str] = []
+        self._stream_chars = 0
+
         # Collapsed content tracking for expand feature
         self._collapsed_results: list[dict] = []
 
@@ -175,6 +406,8 @@ class ChatConsole:
 
         # History file
         self._history = FileHistory(str(settings.history_file))
+        # Most recent prompt this session, so editing it needs no history read
+        self._last_prompt: str | None = None
 
     def _setup_key_callbacks(self) -> None:
         """Set up callbacks for keyboard shortcuts."""
@@ -193,6 +426,7 @@ class ChatConsole:
     def _on_cycle_permission(self, event) -> None:
         """Handle Shift+Tab - cycle permission modes."""
         permission_mode_manager.cycle()
+        self._cached_mode_info = None
         # Force status bar refresh
         event.app.invalidate()
 
@@ -205,19 +439,23 @@ class ChatConsole:
     def _on_edit_previous(self, event) -> None:
         """Handle double-Escape - load previous prompt for editing."""
         buffer = event.app.current_buffer
-        history = list(self._history.load_history_strings())
-        if history:
-            buffer.text = history[-1]
+        previous = self._last_prompt
+        if previous is None:
+            # Nothing entered yet this session; history yields newest first
+            previous = next(iter(self._history.load_history_strings()), None)
+        if previous is not None:
+            buffer.text = previous
             buffer.cursor_position = len(buffer.text)
 
     def _on_expand_content(self, event) -> None:
         """Handle Ctrl+O - expand last collapsed content."""
         if self._collapsed_results:
             last = self._collapsed_results[-1]
-            self.console.print()
-            self.console.print("[dim]── Expanded content ──[/dim]")
-            self.console.print(last.get("full_content", ""))
-            self.console.print("[dim]── End expanded ──[/dim]")
+            with self.console:
+                self.console.print()
+                self.console.print("[dim]── Expanded content ──[/dim]")
+                self.console.print(Text(last.get("full_content", "")))
+                self.console.print("[dim]── End expanded ──[/dim]")
 
     def _get_tool_display_info(self, tool_name: str, arguments: dict) -> tuple[str, str]:
         """Return (display_name, primary_arg) for tool call display.
@@ -248,17 +486,14 @@ class ChatConsole:
         primary_arg = ""
         if tool_name in ("write_file", "read_file", "edit_file"):
             path = arguments.get("path", arguments.get("file_path", ""))
-            primary_arg = path
+            # Paths are shown in full, but a malformed non-string one is bounded
+            primary_arg = path if isinstance(path, str) else short_arg(path)
         elif tool_name in ("bash", "execute_command"):
-            cmd = arguments.get("command", "")
-            # Truncate long commands
-            if len(cmd) > 50:
-                cmd = cmd[:47] + "..."
-            primary_arg = cmd
+            primary_arg = short_arg(arguments.get("command", ""))
         elif tool_name in ("search", "grep"):
-            primary_arg = arguments.get("pattern", arguments.get("query", ""))
+            primary_arg = short_arg(arguments.get("pattern", arguments.get("query", "")))
         elif tool_name == "glob":
-            primary_arg = arguments.get("pattern", "")
+            primary_arg = short_arg(arguments.get("pattern", ""))
         elif tool_name == "todo_write":
             # Don't show args for todo, just the count
             todos = arguments.get("todos", [])
@@ -267,9 +502,12 @@ class ChatConsole:
 
         return display_name, primary_arg
 
-    def _format_file_preview(self, content: str, max_lines: int = 5) -> tuple[str, int]:
+    def _format_file_preview(self, content: str, max_lines: int = 5) -> tuple[Text, int]:
         """Format file content with line numbers and collapse indicator.
 
+        Built as Text so file content is neither parsed as markup nor
+        run through the highlighter.
+
         Returns:
             tuple: (formatted_preview, total_lines)
         """
@@ -277,10 +515,9 @@ class ChatConsole:
         total_lines = len(lines)
 
         if total_lines == 0:
-            return "", 0
+            return Text(), 0
 
         # Calculate line number padding
-        max_line_num = min(max_lines, total_lines)
         padding = len(str(total_lines))
 
         preview_parts = []
@@ -289,25 +526,63 @@ class ChatConsole:
             display_line = line[:100] + "..." if len(line) > 100 else line
             preview_parts.append(f"     {i:>{padding}} {display_line}")
 
-        preview = "\n".join(preview_parts)
+        preview = Text("\n".join(preview_parts))
 
         # Add collapse indicator if there are more lines
         remaining = total_lines - max_lines
         if remaining > 0:
-            preview += f"\n     [dim]... +{remaining} lines (ctrl+o to expand)[/dim]"
+            preview.append(f"\n     ... +{remaining} lines (ctrl+o to expand)", style="dim")
 
         return preview, total_lines
 
     def _get_status_bar(self) -> FormattedText:
-        """Generate the bottom status bar content."""
-        # Context usage bar
+        """Generate the bottom status bar content.
+
+        prompt_toolkit calls this on every repaint, so the fragments are
+        cached: everything but the clock is rebuilt only when its inputs
+        change, and the clock only when the elapsed second ticks over.
+        """
         used = self._status_data.get("context_used", 0)
         max_ctx = self._status_data.get("context_max", settings.num_ctx)
+        model = self._status_data.get("model", settings.model)
+        key = (used, max_ctx, model, permission_mode_manager.current, self._show_thinking)
+        if key != self._status_bar_key:
+            self._status_bar_key = key
+            self._status_bar_static = self._build_status_bar_static(used, max_ctx, model)
+
+        # Session duration
+        elapsed = int(time.monotonic() - self._status_data["session_start"])
+        if elapsed != self._status_bar_elapsed:
+            self._status_bar_elapsed = elapsed
+            minutes, seconds = divmod(elapsed, 60)
+            hours, minutes = divmod(minutes, 60)
+            if hours:
+                time_str = f"{hours}h {minutes}m"
+            else:
+                time_str = f"{minutes}m {seconds}s"
+            self._status_bar_time = [("ansigray", time_str), ("", " ")]
+
+        return FormattedText(self._status_bar_static + self._status_bar_time)
+
+    def _mode_display(self) -> tuple[str, str]:
+        """Return (short_name, ansi_style) for the current permission mode."""
+        mode = permission_mode_manager.current
+        # Also keyed on the mode, since set_mode() can switch it without a keypress
+        if self._cached_mode_info is None or self._cached_mode_info[0] != mode:
+            mode_name, mode_color = permission_mode_manager.get_display_info()
+            self._cached_mode_info = (mode, mode_name, COLOR_TO_ANSI.get(mode_color, "ansiwhite"))
+        return self._cached_mode_info[1], self._cached_mode_info[2]
+
+    def _build_status_bar_static(
+        self, used: int, max_ctx: int, model: str
+    ) -> list[tuple[str, str]]:
+        """Build the status bar fragments that precede the session clock."""
+        # Context usage bar
         percent = (used / max_ctx * 100) if max_ctx else 0
 
-        bar_width = 10
-        filled = int(bar_width * percent / 100)
-        empty = bar_width - filled
+        # Clamped so context over the limit shows a full bar
+        filled = min(int(10 * percent / 100), 10)
+        filled_cells, empty_cells = STATUS_BAR_CELLS[filled]
 
         if percent < 50:
             bar_color = "ansigreen"
@@ -316,34 +591,20 @@ class ChatConsole:
         else:
             bar_color = "ansired"
 
-        # Model name
-        model = self._status_data.get("model", settings.model)
         # Truncate model name if too long
         if len(model) > 20:
             model = model[:17] + "..."
 
         # Permission mode
-        mode_name, mode_color = permission_mode_manager.get_display_info()
-        mode_ansi = {"green": "ansigreen", "yellow": "ansiyellow", "cyan": "ansicyan"}.get(
-            mode_color, "ansiwhite"
-        )
-
-        # Session duration
-        duration = datetime.now() - self._status_data.get("session_start", datetime.now())
-        minutes, seconds = divmod(int(duration.total_seconds()), 60)
-        hours, minutes = divmod(minutes, 60)
-        if hours:
-            time_str = f"{hours}h {minutes}m"
-        else:
-            time_str = f"{minutes}m {seconds}s"
+        mode_name, mode_ansi = self._mode_display()
 
         # Thinking indicator
         think_indicator = "◉" if self._show_thinking else "○"
 
-        return FormattedText([
+        return [
             ("", " "),
-            (bar_color, "█" * filled),
-            ("ansigray", "░" * empty),
+            (bar_color, filled_cells),
+            ("ansigray", empty_cells),
             ("", f" {used:,}/{max_ctx:,}"),
             ("", " │ "),
             ("bold", model),
@@ -352,9 +613,24 @@ class ChatConsole:
             ("", " │ "),
             ("ansigray", f"{think_indicator} Think"),
             ("", " │ "),
-            ("ansigray", time_str),
-            ("", " "),
-        ])
+        ]
+
+    def _get_markdown(self, content: str) -> "Markdown":
+        """Return parsed Markdown for content, reusing recent parses."""
+        from rich.markdown import Markdown
+
+        # Short texts parse quickly; caching them would only evict long ones
+        if len(content) < MARKDOWN_CACHE_MIN_CHARS:
+            return Markdown(content)
+
+        md = self._markdown_cache.get(content)
+        if md is None:
+            md = self._markdown_cache[content] = Markdown(content)
+            if len(self._markdown_cache) > MARKDOWN_CACHE_SIZE:
+                self._markdown_cache.popitem(last=False)
+        else:
+            self._markdown_cache.move_to_end(content)
+        return md
 
     def _get_prompt_session(self) -> PromptSession:
         """Get or create the prompt session."""
@@ -380,14 +656,18 @@ class ChatConsole:
         self._status_data.update(kwargs)
 
     def print_thinking(self, content: str) -> None:
-        """Print thinking/reasoning process in italic gray style."""
+        """Print thinking/reasoning process in italic gray style.
+
+        Does nothing while thinking display is off; callers assembling a
+        reasoning trace should check show_thinking before building it.
+        """
         if not self._show_thinking:
             return
 
         self.console.print(
             Panel(
                 Text(content, style="italic dim"),
-                title="[dim]Thinking...[/dim]",
+                title=THINKING_TITLE,
                 border_style="dim",
                 padding=(0, 1),
             )
@@ -403,7 +683,7 @@ class ChatConsole:
     def start_status(self, message: str) -> None:
         """Start or update the status spinner."""
         if self._status_spinner is None:
-            self._status_spinner = StatusSpinner(self.console)
+            self._status_spinner = StatusSpinner(self.console, self._supports_sync_output)
         self._status_spinner.start(message)
 
     def update_status(self, message: str) -> None:
@@ -420,9 +700,12 @@ class ChatConsole:
 
     def start_streaming(self) -> None:
         """Start streaming panel for real-time output."""
-        self.stop_status()  # Stop spinner when starting to stream
-        self._streaming_panel = StreamingPanel(self.console)
-        self._streaming_panel.start()
+        # The panel takes over the spinner's Live rather than restarting one
+        live = self._status_spinner.hand_off() if self._status_spinner else None
+        self._streaming_panel = StreamingPanel(
+            self.console, sync_output=self._supports_sync_output
+        )
+        self._streaming_panel.start(live)
 
     def stream_chunk(self, chunk: str) -> None:
         """Append a chunk to the streaming output."""
@@ -435,92 +718,149 @@ class ChatConsole:
         Returns the final content.
         """
         if self._streaming_panel:
-            content = self._streaming_panel.finish()
+            panel = self._streaming_panel
             self._streaming_panel = None
-            # Render final content as proper markdown
-            if content:
+            content = panel.content
+            # Render final content as proper markdown, drawn over the streaming panel
+            final = None
+            if content and is_plain_reply(content):
+                # Markdown would draw this exactly like the streamed text
+                final = Panel(
+                    Text(content.strip()),
+                    title=ASSISTANT_TITLE,
+                    border_style="red",
+                    padding=(0, 1),
+                )
+            elif content:
                 try:
-                    md = Markdown(content)
-                    self.console.print(
-                        Panel(
-                            md,
-                            title="[bold red]SkyNet[/bold red]",
-                            border_style="red",
-                            padding=(0, 1),
-                        )
+                    md = self._get_markdown(content)
+                    final = Panel(
+                        md,
+                        title=ASSISTANT_TITLE,
+                        border_style="red",
+                        padding=(0, 1),
                     )
                 except Exception:
-                    self.console.print(
-                        Panel(
-                            content,
-                            title="[bold red]SkyNet[/bold red]",
-                            border_style="red",
-                            padding=(0, 1),
-                        )
+                    final = Panel(
+                        content,
+                        title=ASSISTANT_TITLE,
+                        border_style="red",
+                        padding=(0, 1),
                     )
-            return content
+            return panel.finish(final)
         return ""
 
+    def write(self, *objects: str | Text) -> None:
+        """Add fragments to the current line without printing them yet."""
+        self._line_buffer.extend(objects)
+
+    def writeln(self, *objects: str | Text, **kwargs: Any) -> None:
+        """Print the buffered fragments and objects as one line.
+
+        Fragments are joined without separators and go through a single
+        console.print() call, so the line is rendered and written once.
+        All-string lines are joined first so their markup is parsed once.
+        """
+        self._line_buffer.extend(objects)
+        try:
+            strings = [fragment for fragment in self._line_buffer if isinstance(fragment, str)]
+            if len(strings) == len(self._line_buffer):
+                self.console.print("".join(strings), **kwargs)
+            else:
+                kwargs.setdefault("sep", "")
+                self.console.print(*self._line_buffer, **kwargs)
+        finally:
+            self._line_buffer.clear()
+
     def print_welcome(self, model: str, session_id: str | None = None) -> None:
         """Print welcome message."""
-        session_info = f"[dim]Session: {session_id}[/dim]\n" if session_id else ""
-        self.console.print(
-            Panel(
-                f"[bold red]SkyNet[/bold red] - Local AI Coding Assistant\n"
-                f"[dim]Model: {model}[/dim]\n"
-                f"{session_info}\n"
-                f"[dim]Type your message and press Enter. Use Ctrl+C to exit.[/dim]",
-                border_style="red",
-            )
+        # Assembled from styled parts, so names are shown as-is, not parsed as markup
+        body = Text.assemble(
+            ("SkyNet", "bold red"),
+            " - Local AI Coding Assistant\n",
+            (f"Model: {model}", "dim"),
+            "\n",
         )
+        if session_id:
+            body.append(f"Session: {session_id}", style="dim")
+            body.append("\n")
+        body.append("\n")
+        body.append(WELCOME_HINT)
+        self.console.print(Panel(body, border_style="red"))
 
     def print_user_message(self, content: str) -> None:
         """Print a user message."""
-        self.console.print()
+        # new_line_start puts the spacer line in the same print as the panel
         self.console.print(
             Panel(
-                Text(content, style="white"),
-                title="[bold blue]You[/bold blue]",
+                Text(truncate_for_render(content), style="white"),
+                title=USER_TITLE,
                 border_style="blue",
                 padding=(0, 1),
-            )
+            ),
+            new_line_start=True,
         )
 
     def print_assistant_message(self, content: str) -> None:
         """Print an assistant message with markdown rendering."""
-        self.console.print()
+        content = truncate_for_render(content)
         try:
-            md = Markdown(content)
+            md = self._get_markdown(content)
             self.console.print(
                 Panel(
                     md,
-                    title="[bold red]SkyNet[/bold red]",
+                    title=ASSISTANT_TITLE,
                     border_style="red",
                     padding=(0, 1),
-                )
+                ),
+                new_line_start=True,
             )
         except Exception:
             # Fallback to plain text if markdown fails
             self.console.print(
                 Panel(
                     content,
-                    title="[bold red]SkyNet[/bold red]",
+                    title=ASSISTANT_TITLE,
                     border_style="red",
                     padding=(0, 1),
-                )
+                ),
+                new_line_start=True,
             )
 
     def print_streaming_start(self) -> None:
         """Indicate streaming has started."""
-        self.console.print()
-        self.console.print("[dim red]SkyNet:[/dim red]", end=" ")
+        with self.console:
+            self.console.print()
+            self.console.print("[dim red]SkyNet:[/dim red]", end=" ")
 
     def print_streaming_chunk(self, content: str) -> None:
-        """Print a streaming chunk."""
-        self.console.print(content, end="", markup=False)
+        """Print a streaming chunk.
+
+        Chunks are held back until a newline arrives or STREAM_FLUSH_CHARS
+        accumulate, so a fast stream is written a line at a time rather
+        than a token at a time.
+        """
+        self._stream_buffer.append(content)
+        self._stream_chars += len(content)
+        if self._stream_chars >= STREAM_FLUSH_CHARS or "\n" in content:
+            self._flush_stream()
+
+    def _flush_stream(self) -> None:
+        """Write out any held back streaming chunks."""
+        if self._stream_buffer:
+            text = "".join(self._stream_buffer)
+            if self._plain_output:
+                # Also avoids Rich wrapping the text at its default 80 columns
+                self.console.file.write(text)
+                self.console.file.flush()
+            else:
+                self.console.print(text, end="", markup=False)
+            self._stream_buffer.clear()
+            self._stream_chars = 0
 
     def print_streaming_end(self) -> None:
         """End streaming output."""
+        self._flush_stream()
         self.console.print()
 
     def print_tool_call(self, tool_name: str, arguments: dict) -> None:
@@ -555,27 +895,37 @@ class ChatConsole:
             tool_name: Optional tool name for context-aware formatting
         """
         if success:
-            # Format the summary line with tree connector
-            self.console.print(f"  [dim]⎿[/dim]  {output}")
-
             # If we have file content, show a preview
+            preview, total_lines = None, 0
             if content:
                 preview, total_lines = self._format_file_preview(content, max_lines=5)
+
+            # Summary line with tree connector, written together with the preview.
+            # Tool output is plain text: no markup parsing or highlighting.
+            with self.console:
+                self.console.print(
+                    Text.assemble(
+                        "  ", ("⎿", "dim"), "  ",
+                        truncate_for_render(output, TOOL_RESULT_DISPLAY_CHARS),
+                    )
+                )
                 if preview:
                     self.console.print(preview)
-                    # Store for expand feature if content was collapsed
-                    if total_lines > 5:
-                        self._collapsed_results.append({
-                            "file_path": file_path,
-                            "full_content": content,
-                            "total_lines": total_lines,
-                        })
-                        # Keep only last 10 collapsed results
-                        if len(self._collapsed_results) > 10:
-                            self._collapsed_results.pop(0)
+
+            # Store for expand feature if content was collapsed
+            if preview and total_lines > 5:
+                self._collapsed_results.append({
+                    "file_path": file_path,
+                    "full_content": content,
+                    "total_lines": total_lines,
+                })
+                # Keep only last 10 collapsed results
+                if len(self._collapsed_results) > 10:
+                    self._collapsed_results.pop(0)
         else:
             # Error output - simple red text with tree connector
-            self.console.print(f"  [dim]⎿[/dim]  [red]Error: {output}[/red]")
+            error = truncate_for_render(output, TOOL_RESULT_DISPLAY_CHARS)
+            self.console.print(Text.assemble("  ", ("⎿", "dim"), "  ", (f"Error: {error}", "red")))
 
     def print_error(self, message: str) -> None:
         """Print an error message."""
@@ -595,7 +945,6 @@ class ChatConsole:
         if not todos:
             return
 
-        self.console.print()
         lines = []
         for todo in todos:
             if todo.status == "completed":
@@ -605,12 +954,15 @@ class ChatConsole:
             else:
                 lines.append(f"  [dim][ ] {todo.content}[/dim]")
 
-        self.console.print(Panel(
-            "\n".join(lines),
-            title="[bold]Tasks[/bold]",
-            border_style="dim",
-            padding=(0, 1),
-        ))
+        self.console.print(
+            Panel(
+                "\n".join(lines),
+                title="[bold]Tasks[/bold]",
+                border_style="dim",
+                padding=(0, 1),
+            ),
+            new_line_start=True,
+        )
 
     def get_active_todo_message(self) -> str | None:
         """Get the active todo message for status display."""
@@ -645,14 +997,14 @@ class ChatConsole:
 
     def print_plan(self, plan_markdown: str) -> None:
         """Print a plan."""
-        self.console.print()
         self.console.print(
             Panel(
-                Markdown(plan_markdown),
+                self._get_markdown(plan_markdown),
                 title="[bold cyan]Execution Plan[/bold cyan]",
                 border_style="cyan",
                 padding=(0, 1),
-            )
+            ),
+            new_line_start=True,
         )
 
     def print_plan_approved(self) -> None:
@@ -671,9 +1023,9 @@ class ChatConsole:
             max_tokens: Maximum context window size.
             percent: Percentage of context used.
         """
-        bar_width = 30
-        filled = int(bar_width * percent / 100)
-        empty = bar_width - filled
+        # Clamped so context over the limit shows a full bar
+        filled = min(int(30 * percent / 100), 30)
+        filled_cells, empty_cells = CONTEXT_BAR_CELLS[filled]
 
         # Color based on usage level
         if percent < 50:
@@ -683,9 +1035,8 @@ class ChatConsole:
         else:
             color = "red"
 
-        bar = f"[{color}]{'█' * filled}[/{color}][dim]{'░' * empty}[/dim]"
+        bar = f"[{color}]{filled_cells}[/{color}][dim]{empty_cells}[/dim]"
 
-        self.console.print()
         self.console.print(
             Panel(
                 f"{bar}\n\n"
@@ -693,7 +1044,8 @@ class ChatConsole:
                 title="[bold]Context Usage[/bold]",
                 border_style="dim",
                 padding=(0, 1),
-            )
+            ),
+            new_line_start=True,
         )
 
     def confirm(self, message: str) -> bool:
@@ -708,22 +1060,29 @@ class ChatConsole:
         This is similar to how Claude Code asks for directory-level permission
         once, rather than asking for each individual tool call.
         """
-        self.console.print()
-        self.console.print(
-            Panel(
-                f"[bold]{tool_name}[/bold] wants to operate in:\n\n"
-                f"  [cyan]{directory}[/cyan]\n\n"
-                f"[dim]Approving will allow all tool operations in this directory "
-                f"and its subdirectories for this session.[/dim]",
-                title="[yellow]Permission Required[/yellow]",
-                border_style="yellow",
-                padding=(1, 2),
+        with self.console:
+            self.console.print(
+                Panel(
+                    f"[bold]{tool_name}[/bold] wants to operate in:\n\n"
+                    f"  [cyan]{directory}[/cyan]\n\n"
+                    f"[dim]Approving will allow all tool operations in this directory "
+                    f"and its subdirectories for this session.[/dim]",
+                    title="[yellow]Permission Required[/yellow]",
+                    border_style="yellow",
+                    padding=(1, 2),
+                ),
+                new_line_start=True,
             )
-        )
-        self.console.print("[yellow]Allow operations in this directory?[/yellow] ", end="")
+            self.console.print("[yellow]Allow operations in this directory?[/yellow] ", end="")
         response = input("[y/N]: ").strip().lower()
         return response in ("y", "yes")
 
+    def _remember_prompt(self, text: str) -> None:
+        """Record a submitted prompt for double-Escape editing."""
+        # prompt_toolkit only stores non-empty input in history
+        if text:
+            self._last_prompt = text
+
     async def get_input_async(self, input_prompt: str = "> ") -> str | None:
         """Get user input with slash command autocomplete (async version).
 
@@ -733,7 +1092,9 @@ class ChatConsole:
         """
         try:
             session = self._get_prompt_session()
-            return await session.prompt_async(input_prompt)
+            text = await session.prompt_async(input_prompt)
+            self._remember_prompt(text)
+            return text
         except EOFError:
             return None  # Signal EOF to caller
         except KeyboardInterrupt:
@@ -747,7 +1108,9 @@ class ChatConsole:
         """
         try:
             session = self._get_prompt_session()
-            return session.prompt(input_prompt)
+            text = session.prompt(input_prompt)
+            self._remember_prompt(text)
+            return text
         except EOFError:
             return ""
         except KeyboardInterrupt:
@@ -759,21 +1122,15 @@ class ChatConsole:
             self.console.print("[dim]No saved sessions found.[/dim]")
             return
 
-        self.console.print("\n[bold]Recent Sessions:[/bold]")
+        # One print for the whole list instead of a locked write per session
+        self.write("\n[bold]Recent Sessions:[/bold]")
         for i, session in enumerate(sessions, 1):
-            # Format the date nicely
-            try:
-                from datetime import datetime
-                updated = datetime.fromisoformat(session.updated_at)
-                date_str = updated.strftime("%Y-%m-%d %H:%M")
-            except (ValueError, AttributeError):
-                date_str = session.updated_at[:16] if session.updated_at else "unknown"
-
-            self.console.print(
-                f"  [cyan]{i}.[/cyan] [bold]{session.id}[/bold] - {session.title}\n"
+            date_str = format_session_time(session.updated_at)
+            self.write(
+                f"\n  [cyan]{i}.[/cyan] [bold]{session.id}[/bold] - {session.title}\n"
                 f"      [dim]{date_str} | {session.message_count} messages | {session.model}[/dim]"
             )
-        self.console.print()
+        self.writeln("\n")
 
     def print_session_resumed(self, session_id: str, message_count: int) -> None:
         """Print session resumed message."""
@@ -791,10 +1148,10 @@ class ChatConsole:
             self.console.print("[dim]No models found.[/dim]")
             return
 
-        self.console.print("\n[bold]Available Models:[/bold]")
+        self.write("\n[bold]Available Models:[/bold]")
         for i, model in enumerate(models, 1):
             if model == current_model:
-                self.console.print(f"  [green]{i}. {model} (active)[/green]")
+                self.write(f"\n  [green]{i}. {model} (active)[/green]")
             else:
-                self.console.print(f"  [cyan]{i}.[/cyan] {model}")
-        self.console.print("\n[dim]Use /model <name> or /model <number> to switch[/dim]")
+                self.write(f"\n  [cyan]{i}.[/cyan] {model}")
+        self.writeln("\n\n[dim]Use /model <name> or /model <number> to switch[/dim]")
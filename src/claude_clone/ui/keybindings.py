@@ -1,8 +1,13 @@
 """Keyboard bindings for SkyNet CLI."""
 
+from time import monotonic_ns
+from typing import Callable, Any
+
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.keys import Keys
-from typing import Callable, Any
+
+# A second Escape within this window counts as a double-escape
+DOUBLE_ESCAPE_WINDOW_NS = 500_000_000
 
 
 class KeyBindingManager:
@@ -15,14 +20,13 @@ class KeyBindingManager:
     def __init__(self):
         self.bindings = KeyBindings()
         self._callbacks: dict[str, Callable] = {}
-        self._escape_count = 0
-        self._last_escape_time = 0.0
+        # True when the next quick Escape completes a double-escape
+        self._in_double_window = False
+        self._last_escape_ns = -DOUBLE_ESCAPE_WINDOW_NS
         self._setup_bindings()
 
     def _setup_bindings(self) -> None:
         """Set up all keyboard bindings."""
-        import time
-
         # Ctrl+R - Searchable history (handled by prompt_toolkit when enabled)
         # We just need to make sure enable_history_search=True in PromptSession
 
@@ -36,41 +40,46 @@ class KeyBindingManager:
             elif buffer.text.startswith("/"):
                 # Trigger completion for slash commands
                 buffer.start_completion()
-            elif "toggle_thinking" in self._callbacks:
+            else:
                 # Otherwise toggle thinking display
-                self._callbacks["toggle_thinking"](event)
+                callback = self._callbacks.get("toggle_thinking")
+                if callback:
+                    callback(event)
 
         # Shift+Tab - Cycle permission modes
         @self.bindings.add(Keys.BackTab)
         def handle_shift_tab(event) -> None:
-            if "cycle_permission" in self._callbacks:
-                self._callbacks["cycle_permission"](event)
+            callback = self._callbacks.get("cycle_permission")
+            if callback:
+                callback(event)
 
         # Escape - Interrupt or double-escape for edit previous
         @self.bindings.add(Keys.Escape)
         def handle_escape(event) -> None:
-            current_time = time.time()
-            # Check for double-escape (within 500ms)
-            if current_time - self._last_escape_time < 0.5:
-                self._escape_count += 1
-                if self._escape_count >= 2:
-                    # Double escape - edit previous prompt
-                    if "edit_previous" in self._callbacks:
-                        self._callbacks["edit_previous"](event)
-                    self._escape_count = 0
-            else:
-                self._escape_count = 1
-                # Single escape - interrupt
-                if "interrupt" in self._callbacks:
-                    self._callbacks["interrupt"](event)
+            now = monotonic_ns()
+            # Double-escape needs the second press within 500ms
+            within = now - self._last_escape_ns < DOUBLE_ESCAPE_WINDOW_NS
+            self._last_escape_ns = now
+            # Quick presses alternate between opening and completing a pair
+            self._in_double_window = not (within and self._in_double_window)
 
-            self._last_escape_time = current_time
+            if not within:
+                action = "interrupt"
+            elif not self._in_double_window:
+                action = "edit_previous"
+            else:
+                # A quick third Escape only opens the next pair
+                return
+            callback = self._callbacks.get(action)
+            if callback:
+                callback(event)
 
         # Ctrl+O - Expand last collapsed content
         @self.bindings.add("c-o")
         def handle_ctrl_o(event) -> None:
-            if "expand_content" in self._callbacks:
-                self._callbacks["expand_content"](event)
+            callback = self._callbacks.get("expand_content")
+            if callback:
+                callback(event)
 
     def register_callback(self, action: str, callback: Callable) -> None:
         """Register a callback for a keyboard action.
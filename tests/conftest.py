@@ -43,6 +43,22 @@ def plan_manager_with_temp_dir(tmp_path, plan_manager):
     return plan_manager
 
 
+@pytest.fixture(scope="session")
+def shared_plan_dir(tmp_path_factory):
+    """Provide one plan directory for the session, for tests that only add files."""
+    return tmp_path_factory.mktemp("plans")
+
+
+@pytest.fixture
+def plan_manager_with_shared_dir(shared_plan_dir, plan_manager):
+    """PlanManager saving into the session-wide plan directory.
+
+    Tests using it should save under unique IDs and not list the directory.
+    """
+    plan_manager.plan_dir = shared_plan_dir
+    return plan_manager
+
+
 @pytest.fixture
 def mock_console():
     """Provide a mocked Rich console."""
@@ -52,7 +68,9 @@ def mock_console():
 @pytest.fixture
 def mock_event():
     """Provide a mocked prompt_toolkit event."""
-    event = MagicMock()
+    from prompt_toolkit.key_binding.key_processor import KeyPressEvent
+
+    event = MagicMock(spec=KeyPressEvent)
     event.app = MagicMock()
     return event
 
@@ -60,7 +78,11 @@ def mock_event():
 @pytest.fixture
 def chat_console_with_mocks():
     """Create ChatConsole with mocked dependencies."""
+    from rich.console import Console
+
     with patch("claude_clone.ui.console.Console") as mock_console_cls:
+        # Specced so a misspelled Console method fails instead of passing silently
+        mock_console_cls.return_value = MagicMock(spec=Console)
         with patch("claude_clone.ui.console.FileHistory"):
             from claude_clone.ui.console import ChatConsole
 
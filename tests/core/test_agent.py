@@ -0,0 +1,49 @@
+"""Tests for the Agent message loop."""
+
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from rich.console import Console
+
+from claude_clone.config import Settings
+from claude_clone.core.agent import Agent
+from claude_clone.llm.ollama_provider import ChatChunk
+
+
+class TestAgentStreaming:
+    """Tests for how Agent drives the console while streaming a reply."""
+
+    async def test_spinner_live_handed_to_stream(self):
+        """Verify the reply streams into the spinner's Live instead of a new one."""
+
+        async def chat(**kwargs):
+            yield ChatChunk(content="Hello ")
+            yield ChatChunk(content="there")
+
+        provider = MagicMock()
+        provider.chat = chat
+        registry = MagicMock()
+        registry.get_schemas.return_value = []
+
+        with patch("claude_clone.ui.console.FileHistory"):
+            from claude_clone.ui.console import ChatConsole
+
+            console = ChatConsole()
+        console.console = Console(file=StringIO(), force_terminal=True)
+
+        # The real TokenCounter would download the tiktoken encoding
+        with patch("claude_clone.core.agent.ContextManager") as context_cls:
+            context_cls.return_value.should_summarize.return_value = False
+            agent = Agent(
+                provider=provider,
+                registry=registry,
+                console=console,
+                system_prompt="system",
+                settings=Settings(),
+            )
+
+        with patch("claude_clone.ui.console.SyncedLive") as live_cls:
+            await agent.process_message("hi")
+
+        live_cls.assert_called_once()
+        assert agent.messages[-1].content == "Hello there"
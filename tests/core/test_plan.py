@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime
+from uuid import uuid4
 
 from claude_clone.core.plan import PlanManager, Plan, PlanStep, PlanStatus
 
@@ -134,10 +135,28 @@ class TestPlan:
         plan = Plan(goal="Test", steps=steps)
         md = plan.to_markdown()
 
-        assert "[ ] Pending" in md
-        assert "[>] In progress" in md
-        assert "[x] Completed" in md
-        assert "[-] Skipped" in md
+        expected = ("[ ] Pending", "[>] In progress", "[x] Completed", "[-] Skipped")
+        missing = [line for line in expected if line not in md]
+        assert not missing, missing
+
+    def test_to_markdown_reuses_render(self):
+        """Verify an unchanged plan returns the same markdown object."""
+        plan = Plan(goal="Test", steps=[PlanStep(description="Step")])
+
+        assert plan.to_markdown() is plan.to_markdown()
+
+    def test_to_markdown_reflects_changes(self):
+        """Verify step and plan status changes show up after a render."""
+        step = PlanStep(description="Step")
+        plan = Plan(goal="Test", steps=[step])
+        plan.to_markdown()
+
+        step.status = "completed"
+        plan.status = PlanStatus.APPROVED
+        md = plan.to_markdown()
+
+        assert "[x] Step" in md
+        assert "Status: approved" in md
 
     def test_to_markdown_with_files_affected(self):
         """Test files are listed under steps in markdown."""
@@ -446,14 +465,15 @@ class TestPlanManagerSave:
         assert path.exists()
         assert path.suffix == ".md"
 
-    def test_save_plan_with_custom_id(self, plan_manager_with_temp_dir, sample_steps):
+    def test_save_plan_with_custom_id(self, plan_manager_with_shared_dir, sample_steps):
         """Test save_plan() uses provided plan_id."""
-        manager = plan_manager_with_temp_dir
+        manager = plan_manager_with_shared_dir
         manager.create_plan("Test goal", sample_steps)
 
-        path = manager.save_plan(plan_id="custom_plan_id")
+        plan_id = f"custom_{uuid4().hex}"
+        path = manager.save_plan(plan_id=plan_id)
 
-        assert path.name == "custom_plan_id.md"
+        assert path.name == f"{plan_id}.md"
 
     def test_save_plan_generates_id(self, plan_manager_with_temp_dir, sample_steps):
         """Test save_plan() auto-generates timestamp-based ID."""
@@ -465,9 +485,9 @@ class TestPlanManagerSave:
         # Should be in format YYYYMMDD_HHMMSS.md
         assert len(path.stem) == 15  # 8 digits + underscore + 6 digits
 
-    def test_save_plan_raises_when_no_plan(self, plan_manager_with_temp_dir):
+    def test_save_plan_raises_when_no_plan(self, plan_manager_with_shared_dir):
         """Test save_plan() raises ValueError when no plan exists."""
-        manager = plan_manager_with_temp_dir
+        manager = plan_manager_with_shared_dir
 
         with pytest.raises(ValueError, match="No active plan"):
             manager.save_plan()
@@ -0,0 +1 @@
+# LLM module tests
@@ -0,0 +1,145 @@
+"""Tests for extract_json_tool_call."""
+
+from claude_clone.llm.ollama_provider import extract_json_tool_call
+
+
+class TestStandardFormat:
+    """Tests for the {"name": ..., "arguments": ...} format."""
+
+    def test_single_call(self):
+        """Verify a bare tool-call object is extracted."""
+        remaining, calls = extract_json_tool_call(
+            '{"name": "read_file", "arguments": {"file_path": "a.py"}}'
+        )
+
+        assert remaining is None
+        assert len(calls) == 1
+        assert calls[0].name == "read_file"
+        assert calls[0].arguments == {"file_path": "a.py"}
+
+    def test_nested_arguments(self):
+        """Verify nested argument objects and braces in strings survive."""
+        remaining, calls = extract_json_tool_call(
+            'Sure.\n{"name": "create_plan", "arguments": '
+            '{"goal": "use {braces}", "steps": [{"description": "a \\"}\\" b"}]}}'
+        )
+
+        assert remaining == "Sure."
+        assert calls[0].arguments == {
+            "goal": "use {braces}",
+            "steps": [{"description": 'a "}" b'}],
+        }
+
+    def test_multiple_calls_in_order(self):
+        """Verify several calls are extracted and surrounding text kept."""
+        remaining, calls = extract_json_tool_call(
+            'first {"name": "grep", "arguments": {"pattern": "x"}} then '
+            '{"name": "glob", "arguments": {"pattern": "*.py"}} done'
+        )
+
+        assert [c.name for c in calls] == ["grep", "glob"]
+        assert remaining == "first  then  done"
+
+    def test_escaped_backslash_before_quote(self):
+        """Verify a string ending in an escaped backslash closes correctly."""
+        _, calls = extract_json_tool_call(
+            '{"name": "bash", "arguments": {"command": "echo C:\\\\"}} {"a": 1}'
+        )
+
+        assert calls[0].arguments == {"command": "echo C:\\"}
+
+    def test_call_nested_in_other_object(self):
+        """Verify a tool call wrapped in another object is still found."""
+        _, calls = extract_json_tool_call(
+            '{"tool": {"name": "bash", "arguments": {"command": "ls"}}}'
+        )
+
+        assert [c.name for c in calls] == ["bash"]
+
+    def test_unbalanced_outer_object(self):
+        """Verify an unterminated outer object doesn't hide an inner call."""
+        _, calls = extract_json_tool_call(
+            '{"x": {"name": "bash", "arguments": {"command": "ls"}}'
+        )
+
+        assert [c.name for c in calls] == ["bash"]
+
+    def test_stray_quote_in_prose(self):
+        """Verify an unbalanced quote outside JSON doesn't hide the call."""
+        _, calls = extract_json_tool_call(
+            'The 5" screen: {"name": "bash", "arguments": {"command": "ls"}}'
+        )
+
+        assert [c.name for c in calls] == ["bash"]
+
+    def test_unbalanced_brace_in_quoted_prose(self):
+        """Verify a quoted "{" in prose doesn't desync the scan for a later call."""
+        remaining, calls = extract_json_tool_call(
+            'Let me search for "function foo() {" in the code.\n'
+            '{"name": "grep", "arguments": {"pattern": "function foo"}}'
+        )
+
+        assert [c.name for c in calls] == ["grep"]
+        assert calls[0].arguments == {"pattern": "function foo"}
+        assert remaining == 'Let me search for "function foo() {" in the code.'
+
+    def test_non_dict_arguments_become_empty(self):
+        """Verify non-object arguments are replaced with an empty dict."""
+        _, calls = extract_json_tool_call('{"name": "git_status", "arguments": "none"}')
+
+        assert calls[0].arguments == {}
+
+    def test_malformed_name_key_repaired(self):
+        """Verify the {name": artifact is repaired before parsing."""
+        _, calls = extract_json_tool_call('{name": "git_log", "arguments": {}}')
+
+        assert [c.name for c in calls] == ["git_log"]
+
+
+class TestToolNameFormats:
+    """Tests for the tool_name {...} and tool_name({...}) formats."""
+
+    def test_name_then_object(self):
+        """Verify 'tool_name {...}' is extracted."""
+        remaining, calls = extract_json_tool_call('read_file {"file_path": "a.py"}')
+
+        assert remaining is None
+        assert calls[0].name == "read_file"
+        assert calls[0].arguments == {"file_path": "a.py"}
+
+    def test_calls_ordered_by_tool_then_style(self):
+        """Verify calls keep the tool-list order used before the single-pass scan."""
+        _, calls = extract_json_tool_call(
+            'grep {"pattern": "x"} then read_file({"file_path": "a.py"}) '
+            'and read_file {"file_path": "b.py"}'
+        )
+
+        assert [(c.name, c.arguments) for c in calls] == [
+            ("read_file", {"file_path": "a.py"}),
+            ("read_file", {"file_path": "b.py"}),
+            ("grep", {"pattern": "x"}),
+        ]
+
+    def test_function_call_style(self):
+        """Verify 'tool_name({...})' is extracted including the parens."""
+        remaining, calls = extract_json_tool_call('Running bash({"command": "ls"}) now')
+
+        assert calls[0].name == "bash"
+        assert remaining == "Running  now"
+
+
+class TestNoToolCalls:
+    """Tests for content without tool calls."""
+
+    def test_plain_text_returned(self):
+        """Verify plain text is returned unchanged."""
+        assert extract_json_tool_call("hello world") == ("hello world", [])
+
+    def test_control_tokens_stripped(self):
+        """Verify chat-template control tokens are removed."""
+        assert extract_json_tool_call("<|im_start|>hi<|im_end|>") == ("hi", [])
+
+    def test_non_tool_json_left_alone(self):
+        """Verify unrelated JSON is not treated as a tool call."""
+        content = 'config: {"a": {"b": 1}}'
+        assert extract_json_tool_call(content) == (content, [])
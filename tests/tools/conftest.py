@@ -0,0 +1,17 @@
+"""Shared pytest fixtures for tool tests."""
+
+import pytest
+
+from claude_clone.tools.plan import CreatePlanTool
+
+
+@pytest.fixture(scope="session")
+def plan_tool():
+    """Provide one CreatePlanTool for the session; it holds no state between calls."""
+    return CreatePlanTool()
+
+
+@pytest.fixture(scope="session")
+def plan_schema(plan_tool):
+    """Provide the CreatePlanTool function schema, built once."""
+    return plan_tool.to_schema()
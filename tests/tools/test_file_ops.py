@@ -0,0 +1,150 @@
+"""Tests for file operation tools."""
+
+import os
+import re
+
+import pytest
+
+from claude_clone.tools.file_ops import EditFileTool, WriteFileTool
+from claude_clone.tools.search import scan_file
+
+RETURN_RE = re.compile("return", re.MULTILINE)
+
+
+def keep_mtime(path, st):
+    """Put path's mtime back, as a coarse-grained filesystem clock would."""
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Provide a small file to edit."""
+    path = tmp_path / "sample.py"
+    path.write_text("def foo():\n    return 1\n\ndef bar():\n    return 2\n")
+    return path
+
+
+class TestWriteFileTool:
+    """Tests for WriteFileTool.execute()."""
+
+    async def test_invalidates_grep_cache(self, sample_file):
+        """Verify grep sees a same-size rewrite that keeps the old mtime."""
+        assert scan_file(sample_file, RETURN_RE, 10)[0] == (2, "    return 1")
+        st = sample_file.stat()
+
+        result = await WriteFileTool().execute(
+            file_path=str(sample_file),
+            content=sample_file.read_text().replace("return 1", "return 3"),
+        )
+        keep_mtime(sample_file, st)
+
+        assert result.success is True
+        assert scan_file(sample_file, RETURN_RE, 10)[0] == (2, "    return 3")
+
+
+class TestEditFileTool:
+    """Tests for EditFileTool.execute()."""
+
+    @pytest.fixture
+    def tool(self):
+        """Provide an EditFileTool instance."""
+        return EditFileTool()
+
+    async def test_replaces_unique_match(self, tool, sample_file):
+        """Verify a unique match is replaced in place."""
+        result = await tool.execute(
+            file_path=str(sample_file),
+            old_content="return 1",
+            new_content="return 10",
+        )
+
+        assert result.success is True
+        assert sample_file.read_text() == (
+            "def foo():\n    return 10\n\ndef bar():\n    return 2\n"
+        )
+
+    async def test_missing_content_fails(self, tool, sample_file):
+        """Verify missing content is reported without touching the file."""
+        result = await tool.execute(
+            file_path=str(sample_file),
+            old_content="return 3",
+            new_content="return 30",
+        )
+
+        assert result.success is False
+        assert "Content not found" in result.error
+        assert "return 10" not in sample_file.read_text()
+
+    async def test_ambiguous_content_reports_count(self, tool, sample_file):
+        """Verify multiple matches are rejected with the occurrence count."""
+        sample_file.write_text("x = 1\nx = 1\nx = 1\n")
+        result = await tool.execute(
+            file_path=str(sample_file),
+            old_content="x = 1",
+            new_content="x = 2",
+        )
+
+        assert result.success is False
+        assert "Found 3 occurrences" in result.error
+
+    async def test_empty_old_content_fails(self, tool, sample_file):
+        """Verify an empty search string is rejected."""
+        result = await tool.execute(
+            file_path=str(sample_file),
+            old_content="",
+            new_content="x",
+        )
+
+        assert result.success is False
+
+    async def test_missing_content_hints_at_most_three_lines(self, tool, sample_file):
+        """Verify the similar-lines hint stops after three matches."""
+        sample_file.write_text("".join(f"value = {i}\n" for i in range(10)))
+        result = await tool.execute(
+            file_path=str(sample_file),
+            old_content="value = \nmissing",
+            new_content="x",
+        )
+
+        assert result.success is False
+        assert "Line 3: value = 2" in result.error
+        assert "Line 4" not in result.error
+
+    async def test_preserves_crlf_line_endings(self, tool, sample_file):
+        """Verify LF old_content matches a CRLF file and CRLF is kept."""
+        sample_file.write_bytes(b"a = 1\r\nb = 2\r\n")
+        result = await tool.execute(
+            file_path=str(sample_file),
+            old_content="a = 1\nb = 2",
+            new_content="a = 10\nb = 20",
+        )
+
+        assert result.success is True
+        assert sample_file.read_bytes() == b"a = 10\r\nb = 20\r\n"
+
+    async def test_invalidates_grep_cache(self, tool, sample_file):
+        """Verify grep sees a same-size edit that keeps the old mtime."""
+        assert scan_file(sample_file, RETURN_RE, 10)[0] == (2, "    return 1")
+        st = sample_file.stat()
+
+        result = await tool.execute(
+            file_path=str(sample_file),
+            old_content="return 1",
+            new_content="return 3",
+        )
+        keep_mtime(sample_file, st)
+
+        assert result.success is True
+        assert scan_file(sample_file, RETURN_RE, 10)[0] == (2, "    return 3")
+
+    async def test_binary_file_rejected(self, tool, sample_file):
+        """Verify files containing NUL bytes are not edited."""
+        sample_file.write_bytes(b"\x00\x01abc")
+        result = await tool.execute(
+            file_path=str(sample_file),
+            old_content="abc",
+            new_content="xyz",
+        )
+
+        assert result.success is False
+        assert "binary" in result.error
@@ -0,0 +1,34 @@
+"""Tests for git tools."""
+
+import asyncio
+import sys
+from unittest.mock import MagicMock
+
+from claude_clone.tools import git
+from claude_clone.tools.git import run_git_command_capped
+
+
+class TestRunGitCommandCapped:
+    """Tests for run_git_command_capped()."""
+
+    async def test_truncates_output_of_exited_process(self, monkeypatch):
+        """Verify a process that already exited is truncated without being killed."""
+
+        async def spawn_exited(args, cwd, readonly):
+            # Output fits in the pipe buffer, so the process can exit unread
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                "print('x' * 10000)",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            await process.wait()
+            process.kill = MagicMock(side_effect=ProcessLookupError)
+            return process
+
+        monkeypatch.setattr(git, "_spawn_git", spawn_exited)
+
+        code, stdout, stderr, truncated = await run_git_command_capped(["diff"], max_bytes=100)
+
+        assert (code, stdout, stderr, truncated) == (0, "x" * 100, "", True)
@@ -1,69 +1,79 @@
 """Tests for CreatePlanTool."""
 
+import asyncio
+
 import pytest
 
-from claude_clone.tools.plan import CreatePlanTool
 from claude_clone.tools.base import ToolResult
 from claude_clone.core.plan import PlanManager, PlanStatus
 
+# Third-party deprecations are not what these tests check; asyncio_mode=auto
+# already marks the async tests, so no asyncio mark is needed here.
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+
+@pytest.fixture(scope="module")
+async def single_step_execution(plan_tool):
+    """Execute a one-step plan once; return the result and the plan it stored.
+
+    The plan is captured here because reset_singletons drops the manager
+    before each test runs.
+    """
+    result = await plan_tool.execute(
+        goal="Test goal",
+        steps=[{"description": "First step"}],
+    )
+    return result, PlanManager().current_plan
+
 
 class TestCreatePlanToolMetadata:
     """Tests for CreatePlanTool metadata."""
 
-    def test_tool_name(self):
+    def test_tool_name(self, plan_tool):
         """Verify tool name is 'create_plan'."""
-        tool = CreatePlanTool()
-        assert tool.name == "create_plan"
+        assert plan_tool.name == "create_plan"
 
-    def test_tool_description_exists(self):
+    def test_tool_description_exists(self, plan_tool):
         """Verify description is set and non-empty."""
-        tool = CreatePlanTool()
-        assert tool.description
-        assert len(tool.description) > 0
+        assert plan_tool.description
+        assert len(plan_tool.description) > 0
 
-    def test_required_parameters(self):
+    def test_required_parameters(self, plan_tool):
         """Verify 'goal' and 'steps' are required."""
-        tool = CreatePlanTool()
-        assert "goal" in tool.required
-        assert "steps" in tool.required
+        assert "goal" in plan_tool.required
+        assert "steps" in plan_tool.required
 
-    def test_parameters_schema_has_goal(self):
+    def test_parameters_schema_has_goal(self, plan_tool):
         """Verify goal parameter is correctly defined."""
-        tool = CreatePlanTool()
-        assert "goal" in tool.parameters
-        assert tool.parameters["goal"]["type"] == "string"
+        assert "goal" in plan_tool.parameters
+        assert plan_tool.parameters["goal"]["type"] == "string"
 
-    def test_parameters_schema_has_steps(self):
+    def test_parameters_schema_has_steps(self, plan_tool):
         """Verify steps parameter is correctly defined."""
-        tool = CreatePlanTool()
-        assert "steps" in tool.parameters
-        assert tool.parameters["steps"]["type"] == "array"
+        assert "steps" in plan_tool.parameters
+        assert plan_tool.parameters["steps"]["type"] == "array"
 
-    def test_to_schema_output(self):
+    def test_to_schema_output(self, plan_schema):
         """Test to_schema() produces valid Ollama function schema."""
-        tool = CreatePlanTool()
-        schema = tool.to_schema()
-
-        assert schema["type"] == "function"
-        assert schema["function"]["name"] == "create_plan"
-        assert "description" in schema["function"]
-        assert "parameters" in schema["function"]
-        assert schema["function"]["parameters"]["type"] == "object"
-        assert "goal" in schema["function"]["parameters"]["required"]
-        assert "steps" in schema["function"]["parameters"]["required"]
+        assert plan_schema["type"] == "function"
+        assert plan_schema["function"]["name"] == "create_plan"
+        assert "description" in plan_schema["function"]
+        assert "parameters" in plan_schema["function"]
+        assert plan_schema["function"]["parameters"]["type"] == "object"
+        assert "goal" in plan_schema["function"]["parameters"]["required"]
+        assert "steps" in plan_schema["function"]["parameters"]["required"]
 
 
 class TestCreatePlanToolExecute:
     """Tests for CreatePlanTool execution."""
 
-    @pytest.fixture
-    def tool(self):
-        """Provide a CreatePlanTool instance."""
-        return CreatePlanTool()
+    def test_starts_without_plan(self, plan_manager):
+        """Verify no plan leaks in from a previous test."""
+        assert plan_manager.current_plan is None
 
-    async def test_execute_creates_plan(self, tool):
+    async def test_execute_creates_plan(self, plan_tool, plan_manager):
         """Test successful plan creation."""
-        result = await tool.execute(
+        result = await plan_tool.execute(
             goal="Build a REST API",
             steps=[
                 {"description": "Design endpoints", "files_affected": ["api.py"]},
@@ -73,66 +83,40 @@ class TestCreatePlanToolExecute:
 
         assert result.success is True
 
-        manager = PlanManager()
-        assert manager.current_plan is not None
-        assert manager.current_plan.goal == "Build a REST API"
+        plan = plan_manager.current_plan
+        assert plan is not None
+        assert plan.goal == "Build a REST API"
 
-    async def test_execute_returns_toolresult_ok(self, tool):
+    def test_execute_returns_toolresult_ok(self, single_step_execution):
         """Test execute returns ToolResult with success=True."""
-        result = await tool.execute(
-            goal="Test goal",
-            steps=[{"description": "Step 1"}],
-        )
+        result, _ = single_step_execution
 
         assert isinstance(result, ToolResult)
         assert result.success is True
         assert result.error is None
 
-    async def test_execute_output_contains_markdown(self, tool):
-        """Test output contains plan markdown."""
-        result = await tool.execute(
-            goal="Test goal",
-            steps=[{"description": "First step"}],
-        )
-
-        assert "# Plan: Test goal" in result.output
-        assert "## Steps" in result.output
-        assert "First step" in result.output
-
-    async def test_execute_output_contains_approval_instructions(self, tool):
-        """Test output contains /approve and /reject commands."""
-        result = await tool.execute(
-            goal="Test goal",
-            steps=[{"description": "Step 1"}],
-        )
-
-        assert "/approve" in result.output
-        assert "/reject" in result.output
+    @pytest.mark.parametrize(
+        "needle", ["# Plan: Test goal", "## Steps", "First step", "/approve", "/reject"]
+    )
+    def test_execute_output_contains(self, single_step_execution, needle):
+        """Test output contains the plan markdown and approval commands."""
+        result, _ = single_step_execution
+        assert needle in result.output
 
-    async def test_execute_sets_plan_in_manager(self, tool):
+    def test_execute_sets_plan_in_manager(self, single_step_execution):
         """Test plan is stored in PlanManager.current_plan."""
-        await tool.execute(
-            goal="Test goal",
-            steps=[{"description": "Step 1"}],
-        )
+        _, plan = single_step_execution
+        assert plan is not None
+        assert plan.goal == "Test goal"
 
-        manager = PlanManager()
-        assert manager.current_plan is not None
-        assert manager.current_plan.goal == "Test goal"
-
-    async def test_plan_status_is_pending_approval(self, tool):
+    def test_plan_status_is_pending_approval(self, single_step_execution):
         """Verify created plan has PENDING_APPROVAL status."""
-        await tool.execute(
-            goal="Test goal",
-            steps=[{"description": "Step 1"}],
-        )
-
-        manager = PlanManager()
-        assert manager.current_plan.status == PlanStatus.PENDING_APPROVAL
+        _, plan = single_step_execution
+        assert plan.status == PlanStatus.PENDING_APPROVAL
 
-    async def test_multiple_steps_preserved(self, tool):
+    async def test_multiple_steps_preserved(self, plan_tool, plan_manager):
         """Test all steps are preserved in created plan."""
-        await tool.execute(
+        await plan_tool.execute(
             goal="Multi-step plan",
             steps=[
                 {"description": "Step 1"},
@@ -141,15 +125,12 @@ class TestCreatePlanToolExecute:
             ],
         )
 
-        manager = PlanManager()
-        assert len(manager.current_plan.steps) == 3
-        assert manager.current_plan.steps[0].description == "Step 1"
-        assert manager.current_plan.steps[1].description == "Step 2"
-        assert manager.current_plan.steps[2].description == "Step 3"
+        steps = plan_manager.current_plan.steps
+        assert [step.description for step in steps] == ["Step 1", "Step 2", "Step 3"]
 
-    async def test_files_affected_preserved(self, tool):
+    async def test_files_affected_preserved(self, plan_tool, plan_manager):
         """Test files_affected lists are preserved."""
-        await tool.execute(
+        await plan_tool.execute(
             goal="Test goal",
             steps=[
                 {
@@ -159,42 +140,31 @@ class TestCreatePlanToolExecute:
             ],
         )
 
-        manager = PlanManager()
-        step = manager.current_plan.steps[0]
+        step = plan_manager.current_plan.steps[0]
         assert step.files_affected == ["src/main.py", "src/utils.py"]
 
 
 class TestCreatePlanToolValidation:
     """Tests for CreatePlanTool input validation."""
 
-    @pytest.fixture
-    def tool(self):
-        """Provide a CreatePlanTool instance."""
-        return CreatePlanTool()
-
-    async def test_execute_empty_steps_fails(self, tool):
-        """Test empty steps list returns failure."""
-        result = await tool.execute(goal="Test", steps=[])
-
-        assert result.success is False
-        assert "at least one step" in result.error.lower()
-
-    async def test_execute_step_missing_description_fails(self, tool):
-        """Test step without description returns failure."""
-        result = await tool.execute(
-            goal="Test",
-            steps=[{"files_affected": ["file.py"]}],  # Missing description
-        )
-
-        assert result.success is False
-        assert "missing" in result.error.lower() and "description" in result.error.lower()
-
-    async def test_execute_step_empty_description_fails(self, tool):
-        """Test step with empty description returns failure."""
-        result = await tool.execute(
-            goal="Test",
-            steps=[{"description": ""}],
-        )
+    @pytest.mark.parametrize(
+        "steps,expected",
+        [
+            pytest.param([], ["at least one step"], id="empty-steps"),
+            pytest.param(
+                [{"files_affected": ["file.py"]}],
+                ["missing", "description"],
+                id="missing-description",
+            ),
+            pytest.param([{"description": ""}], ["description"], id="empty-description"),
+        ],
+    )
+    def test_execute_invalid_steps_fails(self, plan_tool, steps, expected):
+        """Test invalid step lists return a failure naming the problem."""
+        # Validation never awaits anything, so skip the per-test event loop fixture
+        result = asyncio.run(plan_tool.execute(goal="Test", steps=steps))
 
         assert result.success is False
-        assert "description" in result.error.lower()
+        error = result.error.lower()
+        missing = [text for text in expected if text not in error]
+        assert not missing, missing
@@ -0,0 +1,38 @@
+"""Tests for the tool registry."""
+
+import pytest
+
+from claude_clone.tools.registry import ToolRegistry
+from claude_clone.tools.todo import TodoWriteTool
+
+
+class TestToolRegistry:
+    """Tests for ToolRegistry."""
+
+    @pytest.fixture
+    def registry(self):
+        """Provide a registry with the default tools."""
+        registry = ToolRegistry()
+        registry.register_default_tools()
+        return registry
+
+    def test_schemas_are_cached(self, registry):
+        """Verify repeated calls reuse the same schema list."""
+        assert registry.get_schemas() is registry.get_schemas()
+
+    def test_register_invalidates_schemas(self):
+        """Verify registering a tool rebuilds the schema list."""
+        registry = ToolRegistry()
+        assert registry.get_schemas() == []
+
+        registry.register(TodoWriteTool())
+
+        names = [schema["function"]["name"] for schema in registry.get_schemas()]
+        assert names == ["todo_write"]
+
+    async def test_execute_unknown_tool(self, registry):
+        """Verify unknown tool names fail without raising."""
+        result = await registry.execute("no_such_tool", {})
+
+        assert result.success is False
+        assert "Unknown tool: no_such_tool" in result.error
@@ -0,0 +1,357 @@
+"""Tests for search tools."""
+
+import asyncio
+import os
+import re
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from claude_clone.tools import search
+from claude_clone.tools.search import GlobTool, GrepTool, ScanCache, scan_cache, scan_file
+
+
+@pytest.fixture
+def source_tree(tmp_path, monkeypatch):
+    """Provide a small source tree and make it the working directory."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("import os\n\ndef main():\n    return os.getcwd()\n")
+    (tmp_path / "src" / "util.py").write_text("def helper():\n    return 'main'\n")
+    (tmp_path / "README.md").write_text("Run main() to start\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "dep.py").write_text("def main(): pass\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestGrepToolPython:
+    """Tests for the pure-Python GrepTool search."""
+
+    @pytest.fixture(autouse=True)
+    def no_ripgrep(self, monkeypatch):
+        """Force the Python fallback with an empty scan cache."""
+        monkeypatch.setattr(search, "find_ripgrep", lambda: None)
+        scan_cache.clear()
+
+    @pytest.fixture
+    def tool(self):
+        """Provide a GrepTool instance."""
+        return GrepTool()
+
+    async def test_finds_matches_with_line_numbers(self, tool, source_tree):
+        """Verify matches are reported as path:line: text."""
+        result = await tool.execute(pattern=r"def main")
+
+        assert result.success is True
+        assert result.output == "src/app.py:3: def main():"
+
+    async def test_skips_excluded_directories(self, tool, source_tree):
+        """Verify node_modules and similar directories are not searched."""
+        result = await tool.execute(pattern="main")
+
+        assert "node_modules" not in result.output
+        assert result.metadata["files_matched"] == 3
+
+    async def test_glob_filter(self, tool, source_tree):
+        """Verify the glob parameter restricts the files searched."""
+        result = await tool.execute(pattern="main", glob="*.md")
+
+        assert result.output == "README.md:1: Run main() to start"
+
+    async def test_path_glob_filter(self, tool, source_tree):
+        """Verify globs containing a directory part are honoured."""
+        result = await tool.execute(pattern="main", glob="src/*.py")
+
+        assert result.metadata["files_matched"] == 2
+        assert "README.md" not in result.output
+
+    async def test_case_insensitive(self, tool, source_tree):
+        """Verify case_insensitive matches regardless of case."""
+        result = await tool.execute(pattern="IMPORT OS", case_insensitive=True)
+
+        assert result.output == "src/app.py:1: import os"
+
+    async def test_max_results_truncates(self, tool, source_tree):
+        """Verify results stop at max_results with a truncation note."""
+        result = await tool.execute(pattern="main", max_results=1)
+
+        assert result.metadata["matches"] == 1
+        assert "[Results truncated at 1." in result.output
+
+    async def test_no_matches(self, tool, source_tree):
+        """Verify a search without hits succeeds with a message."""
+        result = await tool.execute(pattern="does_not_exist")
+
+        assert result.success is True
+        assert "No matches found" in result.output
+
+    async def test_repeated_search_sees_file_changes(self, tool, source_tree):
+        """Verify cached per-file results are dropped when a file changes."""
+        first = await tool.execute(pattern="helper")
+        (source_tree / "src" / "util.py").write_text("def renamed():\n    pass\n")
+        second = await tool.execute(pattern="helper")
+
+        assert first.output == "src/util.py:1: def helper():"
+        assert "No matches found" in second.output
+
+    async def test_skips_binary_files(self, tool, source_tree):
+        """Verify files with a NUL byte near the start are not searched."""
+        (source_tree / "blob.bin").write_bytes(b"\x00\x01def main\n")
+        result = await tool.execute(pattern="def main")
+
+        assert "blob.bin" not in result.output
+        assert result.metadata["files_matched"] == 1
+
+    async def test_skips_files_shorter_than_pattern(self, tool, source_tree, monkeypatch):
+        """Verify files too small to hold a match are never opened."""
+        (source_tree / "tiny.txt").write_text("ab\n")
+        opened = []
+        real_read = search.read_searchable
+        monkeypatch.setattr(
+            search,
+            "read_searchable",
+            lambda path, *args: opened.append(path.name) or real_read(path, *args),
+        )
+
+        await tool.execute(pattern=r"\w+ main")
+
+        assert "tiny.txt" not in opened
+        assert "app.py" in opened
+
+    @pytest.mark.parametrize("newline", [b"\r\n", b"\r"], ids=["crlf", "cr"])
+    @pytest.mark.parametrize("literal", ["foo", None], ids=["literal", "regex"])
+    def test_carriage_return_line_endings(self, tmp_path, newline, literal):
+        """Verify literal and regex scans split CRLF and CR-only files the same way."""
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(newline.join([b"alpha", b"beta foo", b"gamma"]) + newline)
+        regex = re.compile("foo" if literal else "fo+", re.MULTILINE)
+
+        assert scan_file(path, regex, 10, literal) == [(2, "beta foo")]
+
+    @pytest.mark.parametrize(
+        "separator", ["\f", "\v", "\x1c", "\x85", "\u2028"], ids=["ff", "vt", "fs", "nel", "ls"]
+    )
+    @pytest.mark.parametrize("literal", ["foo", None], ids=["literal", "regex"])
+    def test_other_line_boundaries(self, tmp_path, separator, literal):
+        """Verify lines are numbered the way str.splitlines() breaks them."""
+        path = tmp_path / "breaks.txt"
+        path.write_text(f"alpha{separator}beta\ngamma foo\n", encoding="utf-8")
+        regex = re.compile("foo" if literal else "fo+", re.MULTILINE)
+
+        assert scan_file(path, regex, 10, literal) == [(3, "gamma foo")]
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [(r"\Afoo", [(1, "foo one"), (3, "foo three")]), (r"bar\Z", [(2, "two bar")])],
+        ids=["start", "end"],
+    )
+    def test_buffer_anchors_match_each_line(self, tmp_path, pattern, expected):
+        """Verify \\A and \\Z anchor to each line, not just the whole file."""
+        path = tmp_path / "anchors.txt"
+        path.write_text("foo one\ntwo bar\nfoo three\n")
+
+        assert scan_file(path, re.compile(pattern, re.MULTILINE), 10) == expected
+
+    async def test_invalid_regex(self, tool, source_tree):
+        """Verify an invalid pattern is reported as a failure."""
+        result = await tool.execute(pattern="(unclosed")
+
+        assert result.success is False
+        assert "Invalid regex" in result.error
+
+
+class TestHyperscanPrefilter:
+    """Tests for the optional Hyperscan prefilter."""
+
+    @pytest.fixture(autouse=True)
+    def require_hyperscan(self):
+        """Skip when the optional dependency isn't installed."""
+        pytest.importorskip("hyperscan")
+
+    def test_rejects_non_matching_data(self):
+        """Verify data without a match is rejected."""
+        prefilter = search.compile_prefilter(r"def \w+\(", False)
+
+        assert prefilter.might_match("x = 1\ndef main():\n") is True
+        assert prefilter.might_match("x = 1\n") is False
+
+    def test_unsupported_constructs_still_prefilter(self):
+        """Verify lookbehind patterns compile in prefilter mode."""
+        prefilter = search.compile_prefilter(r"(?<=return )main", False)
+
+        assert prefilter.might_match("return main") is True
+
+    def test_open_lower_bound_repeat_not_prefiltered(self):
+        """Verify "{,n}", literal text to Hyperscan, gets no prefilter."""
+        assert search.compile_prefilter(r"a{,3}", False) is None
+        assert search.compile_prefilter(r"x{ ,2}yz", False) is None
+
+    @pytest.mark.parametrize(
+        "pattern,data",
+        [
+            (r"a{,3}", b"aaa\n"),
+            (r"x{,2}yz", b"xyz\n"),
+            (r"caf.", b"caf\xe9 ok\n"),
+            (r"\w+ ok", b"caf\xe9 ok\n"),
+            (r"foo$", b"foo\r\nbar\r\n"),
+            (r"^bar", b"foo\x0cbar\n"),
+            (r"bar\Z", b"bar\nfoo\n"),
+        ],
+        ids=["repeat", "repeat-suffix", "latin1-dot", "latin1-word", "crlf", "formfeed", "end"],
+    )
+    def test_scan_matches_like_python(self, tmp_path, pattern, data):
+        """Verify the prefilter never hides a line Python's re would match."""
+        scan_cache.clear()
+        path = tmp_path / "sample.txt"
+        path.write_bytes(data)
+
+        assert scan_file(path, re.compile(pattern, re.MULTILINE), 10)
+
+
+class TestScanCache:
+    """Tests for ScanCache's size limit and invalidation."""
+
+    @pytest.fixture
+    def st(self, tmp_path):
+        """Provide stat results for a file the cache entries can refer to."""
+        path = tmp_path / "f.txt"
+        path.write_text("x\n")
+        return path.stat()
+
+    def test_evicts_oldest_past_byte_limit(self, st):
+        """Verify entries are evicted by size, oldest first."""
+        cache = ScanCache(max_bytes=search.SCAN_CACHE_ENTRY_OVERHEAD * 3 + 3000)
+        line = [(1, "x" * 1000)]
+        cache.put(("a", "p", 0), st, True, line)
+        cache.put(("b", "p", 0), st, True, line)
+        cache.put(("c", "p", 0), st, True, line)
+
+        assert cache.get(("a", "p", 0), st) is None
+        assert cache.get(("b", "p", 0), st) == (True, line)
+        assert cache.get(("c", "p", 0), st) == (True, line)
+
+    def test_skips_entry_larger_than_limit(self, st):
+        """Verify an entry bigger than the whole cache isn't stored."""
+        cache = ScanCache(max_bytes=1000)
+        cache.put(("a", "p", 0), st, True, [])
+        cache.put(("b", "p", 0), st, True, [(1, "x" * 1000)])
+
+        assert cache.get(("a", "p", 0), st) == (True, [])
+        assert cache.get(("b", "p", 0), st) is None
+
+    def test_invalidate_drops_every_pattern_for_path(self, st, tmp_path):
+        """Verify invalidate() removes only the given path's entries."""
+        cache = ScanCache()
+        path = tmp_path / "f.txt"
+        cache.put((str(path), "a", 0), st, True, [])
+        cache.put((str(path), "b", 0), st, True, [])
+        cache.put(("other", "a", 0), st, True, [])
+
+        cache.invalidate(path)
+
+        assert cache.get((str(path), "a", 0), st) is None
+        assert cache.get((str(path), "b", 0), st) is None
+        assert cache.get(("other", "a", 0), st) == (True, [])
+
+
+class TestGrepToolRipgrep:
+    """Tests for the ripgrep-backed GrepTool search."""
+
+    @pytest.fixture
+    def fake_rg(self, tmp_path, monkeypatch):
+        """Install a stand-in rg that prints ripgrep's --null output format."""
+        output = tmp_path / "rg_output"
+        output.write_bytes(b"src/app.py\x003:def main():\nsrc/util.py\x002:    return 'main'\n")
+        script = tmp_path / "rg"
+        script.write_text(f"#!/bin/sh\ncat '{output}'\n")
+        script.chmod(0o755)
+        monkeypatch.setattr(search, "find_ripgrep", lambda: str(script))
+        return script
+
+    async def test_parses_ripgrep_output(self, source_tree, fake_rg):
+        """Verify ripgrep output is reformatted like the Python search."""
+        result = await GrepTool().execute(pattern="main")
+
+        assert result.output == "src/app.py:3: def main():\nsrc/util.py:2: return 'main'"
+        assert result.metadata["files_matched"] == 2
+
+    async def test_max_results_with_exited_rg(self, source_tree, fake_rg, monkeypatch):
+        """Verify hitting max_results after rg exited doesn't try to kill it."""
+        real_exec = asyncio.create_subprocess_exec
+
+        async def exec_exited(*args, **kwargs):
+            process = await real_exec(*args, **kwargs)
+            await process.wait()
+            process.kill = MagicMock(side_effect=ProcessLookupError)
+            return process
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", exec_exited)
+
+        result = await GrepTool().execute(pattern="main", max_results=1)
+
+        assert result.success is True
+        assert result.output.startswith("src/app.py:3: def main():")
+
+
+class TestGlobTool:
+    """Tests for GlobTool."""
+
+    @pytest.fixture
+    def tool(self):
+        """Provide a GlobTool instance."""
+        return GlobTool()
+
+    async def test_finds_recursive_matches(self, tool, source_tree):
+        """Verify ** matches files in subdirectories, skipping excluded ones."""
+        result = await tool.execute(pattern="**/*.py")
+
+        assert result.success is True
+        assert result.metadata["count"] == 2
+        assert "[f] src/app.py" in result.output
+        assert "node_modules" not in result.output
+
+    async def test_newest_first_and_truncated(self, tool, source_tree):
+        """Verify results are ordered by mtime and cut at max_results."""
+        os.utime(source_tree / "src" / "app.py", (1000, 1000))
+        os.utime(source_tree / "src" / "util.py", (2000, 2000))
+        os.utime(source_tree / "README.md", (3000, 3000))
+
+        result = await tool.execute(pattern="**/*.*", max_results=2)
+
+        assert result.output.splitlines()[:2] == ["[f] README.md", "[f] src/util.py"]
+        assert result.metadata["truncated"] is True
+
+    async def test_marks_directories(self, tool, source_tree):
+        """Verify directory matches are tagged [d]."""
+        result = await tool.execute(pattern="s*")
+
+        assert result.output == "[d] src"
+
+    async def test_no_matches(self, tool, source_tree):
+        """Verify an unmatched pattern succeeds with a count of zero."""
+        result = await tool.execute(pattern="**/*.rs")
+
+        assert result.success is True
+        assert result.metadata["count"] == 0
+
+    async def test_literal_and_wildcard_segments(self, tool, source_tree):
+        """Verify mixed literal/wildcard patterns match like Path.glob."""
+        result = await tool.execute(pattern="src/a*.py")
+
+        assert result.output == "[f] src/app.py"
+
+    @pytest.mark.parametrize("pattern", ["src/", "*/", "README.md/", "**/"])
+    def test_trailing_separator_matches_directories_only(self, source_tree, pattern):
+        """Verify a trailing separator matches like Path.glob, directories only."""
+        segments = search.compile_glob(pattern)
+        found = {Path(m) for m in search.iter_glob(str(source_tree), segments)}
+
+        assert found == {p for p in source_tree.glob(pattern) if "node_modules" not in p.parts}
+
+    async def test_invalid_recursive_segment(self, tool, source_tree):
+        """Verify ** inside a component is rejected."""
+        result = await tool.execute(pattern="src**/*.py")
+
+        assert result.success is False
+        assert "'**' can only be an entire path component" in result.error
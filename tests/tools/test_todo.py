@@ -0,0 +1,66 @@
+"""Tests for the todo tool."""
+
+import pytest
+
+from claude_clone.tools.todo import TodoItem, TodoManager, TodoWriteTool
+
+
+class TestTodoManager:
+    """Tests for TodoManager."""
+
+    def test_counts_and_active_follow_update(self):
+        """Verify counters and the active item are refreshed by update()."""
+        manager = TodoManager()
+        manager.update([
+            TodoItem("Write code", "completed", "Writing code"),
+            TodoItem("Run tests", "in_progress", "Running tests"),
+            TodoItem("Ship it", "pending", "Shipping it"),
+            TodoItem("Celebrate", "pending", "Celebrating"),
+        ])
+
+        assert manager.get_completed_count() == 1
+        assert manager.get_pending_count() == 2
+        assert manager.get_active().content == "Run tests"
+
+        manager.update([])
+
+        assert manager.get_completed_count() == 0
+        assert manager.get_pending_count() == 0
+        assert manager.get_active() is None
+
+    def test_format_display(self):
+        """Verify each status gets its checkbox."""
+        manager = TodoManager()
+        manager.update([
+            TodoItem("A", "completed", "Doing A"),
+            TodoItem("B", "in_progress", "Doing B"),
+            TodoItem("C", "pending", "Doing C"),
+        ])
+
+        assert manager.format_display() == "[x] A\n[>] B\n[ ] C"
+
+
+class TestTodoWriteTool:
+    """Tests for TodoWriteTool.execute()."""
+
+    @pytest.fixture
+    def tool(self):
+        """Provide a TodoWriteTool instance."""
+        return TodoWriteTool()
+
+    async def test_summary(self, tool):
+        """Verify the output ends with counts and the active task."""
+        result = await tool.execute(todos=[
+            {"content": "Run tests", "status": "in_progress", "active_form": "Running tests"},
+            {"content": "Fix bugs", "status": "pending", "active_form": "Fixing bugs"},
+        ])
+
+        assert result.success is True
+        assert result.output.endswith("0 completed, 1 pending | Currently: Running tests")
+
+    async def test_missing_field(self, tool):
+        """Verify a todo without a required field is rejected."""
+        result = await tool.execute(todos=[{"content": "Run tests", "status": "pending"}])
+
+        assert result.success is False
+        assert "Missing required field" in result.error
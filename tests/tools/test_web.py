@@ -0,0 +1,194 @@
+"""Tests for web tools."""
+
+import httpx
+import pytest
+
+from claude_clone.tools import web
+from claude_clone.tools.web import LxmlTextExtractor, TextExtractor, WebCache, WebFetchTool
+
+PAGE = (
+    "<html><head><style>body { color: red; }</style></head><body>"
+    "<nav>Home | About</nav><h1>Title</h1>"
+    "<p>First   paragraph\n spans lines.</p><!-- note --><p>Second &amp; last</p>"
+    "<script>var x = 1;</script><footer>Copyright</footer></body></html>"
+)
+
+
+@pytest.fixture(params=["python", "lxml"])
+def extractor_class(request):
+    """Provide each text extractor implementation."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+        return LxmlTextExtractor
+    return TextExtractor
+
+
+class TestTextExtractor:
+    """Tests for the HTML text extractors."""
+
+    def test_extracts_visible_text(self, extractor_class):
+        """Verify skipped tags are dropped and whitespace is collapsed."""
+        extractor = extractor_class()
+        extractor.feed(PAGE)
+
+        assert extractor.get_text() == "Title First paragraph spans lines. Second & last"
+
+    def test_chunked_feed_matches_whole_feed(self, extractor_class):
+        """Verify feeding a page in small chunks gives the same text."""
+        whole = extractor_class()
+        whole.feed(PAGE)
+
+        for size in (1, 3, 7, 16):
+            chunked = extractor_class()
+            for i in range(0, len(PAGE), size):
+                chunked.feed(PAGE[i:i + size])
+            assert chunked.get_text() == whole.get_text()
+
+    def test_total_chars_matches_text_length(self, extractor_class):
+        """Verify total_chars tracks the length of the extracted text."""
+        extractor = extractor_class()
+        extractor.feed(PAGE)
+        text = extractor.get_text()
+
+        assert extractor.total_chars == len(text)
+
+
+class TestWebCache:
+    """Tests for WebCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Provide a cache backed by a temporary database."""
+        cache = WebCache(tmp_path / "cache.sqlite3", ttl=60)
+        yield cache
+        cache.close()
+
+    def test_round_trip(self, cache):
+        """Verify stored values come back fresh."""
+        key = WebCache.make_key("web_search", "python", 5)
+        cache.set(key, ["output", 3])
+
+        entry = cache.get(key)
+        assert entry.value == ["output", 3]
+        assert entry.fresh is True
+
+    def test_missing_key(self, cache):
+        """Verify unknown keys miss."""
+        assert cache.get(WebCache.make_key("web_fetch", "http://x", 10)) is None
+
+    def test_expired_entry_without_etag_misses(self, cache, monkeypatch):
+        """Verify entries past the TTL are dropped unless they can be revalidated."""
+        cache.set("plain", "old")
+        cache.set("tagged", "old", etag='"v1"')
+        monkeypatch.setattr(web.time, "time", lambda: 1e12)
+
+        assert cache.get("plain") is None
+        entry = cache.get("tagged")
+        assert entry.fresh is False
+        assert entry.etag == '"v1"'
+
+    def test_unwritable_path_misses(self, tmp_path):
+        """Verify a cache directory that cannot be created acts as a miss."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = WebCache(blocker / "cache.sqlite3")
+
+        cache.set("key", "value")
+        assert cache.get("key") is None
+
+    def test_corrupt_row_misses(self, cache):
+        """Verify a stored value that is not valid JSON acts as a miss."""
+        cache.set("key", "value")
+        cache._connect().execute("UPDATE cache SET value = '{' WHERE key = 'key'")
+
+        assert cache.get("key") is None
+
+
+class TestWebFetchTool:
+    """Tests for WebFetchTool.execute() against a mock transport."""
+
+    @pytest.fixture
+    def tool(self):
+        """Provide a WebFetchTool instance."""
+        return WebFetchTool()
+
+    @pytest.fixture(autouse=True)
+    def temp_cache(self, tmp_path, monkeypatch):
+        """Keep fetched pages out of the real cache."""
+        cache = WebCache(tmp_path / "cache.sqlite3")
+        monkeypatch.setattr(web, "web_cache", cache)
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    async def transport(self, monkeypatch):
+        """Route the shared client through a handler tests can set."""
+        state = {"handler": None, "requests": []}
+
+        def handle(request):
+            state["requests"].append(request)
+            return state["handler"](request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handle))
+        monkeypatch.setattr(web, "get_http_client", lambda: client)
+        yield state
+        await client.aclose()
+
+    async def test_fetches_page_text(self, tool, transport):
+        """Verify page text is extracted and prefixed with the URL."""
+        transport["handler"] = lambda request: httpx.Response(200, text=PAGE)
+        result = await tool.execute(url="http://example.com/")
+
+        assert result.success is True
+        assert result.output.startswith("Content from http://example.com/:\n\nTitle First")
+
+    async def test_truncates_at_max_length(self, tool, transport):
+        """Verify long pages are cut at max_length."""
+        body = "<p>word</p>" * 10000
+        transport["handler"] = lambda request: httpx.Response(200, text=body)
+        result = await tool.execute(url="http://example.com/", max_length=20)
+
+        assert result.output.endswith("word word word word \n\n[Content truncated...]")
+
+    async def test_http_error(self, tool, transport):
+        """Verify error statuses are reported."""
+        transport["handler"] = lambda request: httpx.Response(404)
+        result = await tool.execute(url="http://example.com/missing")
+
+        assert result.success is False
+        assert "HTTP error 404" in result.error
+
+    async def test_repeat_fetch_uses_cache(self, tool, transport):
+        """Verify a second fetch within the TTL doesn't hit the network."""
+        transport["handler"] = lambda request: httpx.Response(200, text=PAGE)
+        first = await tool.execute(url="http://example.com/")
+        second = await tool.execute(url="http://example.com/")
+
+        assert second.output == first.output
+        assert len(transport["requests"]) == 1
+
+    async def test_stale_entry_revalidated_with_etag(self, tool, transport, temp_cache):
+        """Verify a stale cached page is reused when the server answers 304."""
+        def handler(request):
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=PAGE, headers={"ETag": '"v1"'})
+
+        transport["handler"] = handler
+        first = await tool.execute(url="http://example.com/")
+        temp_cache.ttl = 0
+        second = await tool.execute(url="http://example.com/")
+
+        assert second.output == first.output
+        assert transport["requests"][-1].headers["if-none-match"] == '"v1"'
+
+
+class TestHttpClient:
+    """Tests for the shared web_fetch client."""
+
+    async def test_client_is_reused(self):
+        """Verify the same client is returned within one event loop."""
+        try:
+            assert web.get_http_client() is web.get_http_client()
+        finally:
+            await web.close_http_client()
@@ -0,0 +1,40 @@
+"""Tests for ChatConsole prompt history editing."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+
+class TestEditPrevious:
+    """Tests for the double-Escape edit previous prompt action."""
+
+    def test_uses_last_prompt_without_reading_history(self, chat_console_with_mocks, mock_event):
+        """Verify the prompt entered this session is loaded from memory."""
+        console = chat_console_with_mocks
+        console._last_prompt = "fix the tests"
+
+        console._on_edit_previous(mock_event)
+
+        buffer = mock_event.app.current_buffer
+        assert buffer.text == "fix the tests"
+        assert buffer.cursor_position == len("fix the tests")
+        console._history.load_history_strings.assert_not_called()
+
+    def test_falls_back_to_newest_history_entry(self, chat_console_with_mocks, mock_event):
+        """Verify the newest saved prompt is used before anything is entered."""
+        console = chat_console_with_mocks
+        console._history.load_history_strings.return_value = iter(["newest", "oldest"])
+
+        console._on_edit_previous(mock_event)
+
+        assert mock_event.app.current_buffer.text == "newest"
+
+    async def test_get_input_remembers_prompt(self, chat_console_with_mocks):
+        """Verify submitted input becomes the prompt to edit."""
+        console = chat_console_with_mocks
+        session = MagicMock()
+        session.prompt_async = AsyncMock(side_effect=["first", ""])
+        console._prompt_session = session
+
+        await console.get_input_async()
+        await console.get_input_async()
+
+        assert console._last_prompt == "first"
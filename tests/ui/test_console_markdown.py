@@ -0,0 +1,98 @@
+"""Tests for ChatConsole markdown rendering."""
+
+import io
+
+from rich.console import Console
+from rich.panel import Panel
+
+from claude_clone.ui import console as console_module
+
+
+class TestMarkdownCache:
+    """Tests for the parsed Markdown cache."""
+
+    def test_same_content_reuses_parse(self, chat_console_with_mocks):
+        """Verify printing the same message twice parses it once."""
+        console = chat_console_with_mocks
+
+        content = "# Title\n\n" + "Body text. " * 40
+        console.print_assistant_message(content)
+        console.print_assistant_message(content)
+
+        panels = [c.args[0] for c in console.console.print.call_args_list if c.args]
+        markdowns = [p.renderable for p in panels if isinstance(p, Panel)]
+        assert len(markdowns) == 2
+        assert markdowns[0] is markdowns[1]
+
+    def test_cache_is_bounded(self, chat_console_with_mocks):
+        """Verify only the most recent messages stay cached."""
+        console = chat_console_with_mocks
+
+        padding = "x" * console_module.MARKDOWN_CACHE_MIN_CHARS
+        for i in range(console_module.MARKDOWN_CACHE_SIZE + 5):
+            console._get_markdown(f"message {i} {padding}")
+
+        assert len(console._markdown_cache) == console_module.MARKDOWN_CACHE_SIZE
+        assert f"message 0 {padding}" not in console._markdown_cache
+
+    def test_short_content_not_cached(self, chat_console_with_mocks):
+        """Verify short texts are parsed without taking a cache slot."""
+        console = chat_console_with_mocks
+
+        console._get_markdown("# Title\n\nBody")
+
+        assert not console._markdown_cache
+
+
+class TestRenderTruncation:
+    """Tests for capping message text before Rich lays it out."""
+
+    def test_short_content_unchanged(self):
+        """Verify content under the limit is passed through."""
+        assert console_module.truncate_for_render("hello") == "hello"
+
+    def test_long_content_truncated(self):
+        """Verify content over the limit is cut with a note."""
+        content = "x" * (console_module.MAX_RENDER_CHARS + 1234)
+
+        rendered = console_module.truncate_for_render(content)
+
+        assert rendered.startswith("x" * console_module.MAX_RENDER_CHARS + "\n")
+        assert rendered.endswith("…[1,234 more chars]")
+
+    def test_user_message_truncated(self, chat_console_with_mocks):
+        """Verify huge user messages are truncated before printing."""
+        console = chat_console_with_mocks
+
+        console.print_user_message("y" * (console_module.MAX_RENDER_CHARS * 2))
+
+        panel = console.console.print.call_args_list[-1].args[0]
+        assert len(panel.renderable.plain) < console_module.MAX_RENDER_CHARS + 100
+
+
+class TestPlainReply:
+    """Tests for skipping Markdown on short plain replies."""
+
+    def test_plain_text_detected(self):
+        """Verify short text without Markdown syntax is plain."""
+        assert console_module.is_plain_reply("Done, 3 files updated.") is True
+
+    def test_markdown_syntax_detected(self):
+        """Verify inline syntax, list markers and line breaks need Markdown."""
+        for content in ("Use `ls`", "**bold**", "- item", "1. step", "one\ntwo"):
+            assert console_module.is_plain_reply(content) is False
+
+    def test_long_text_not_plain(self):
+        """Verify long replies always go through Markdown."""
+        content = "word " * console_module.PLAIN_REPLY_MAX_CHARS
+        assert console_module.is_plain_reply(content) is False
+
+    def test_finish_streaming_skips_markdown(self, chat_console_with_mocks):
+        """Verify a plain reply is finished without parsing Markdown."""
+        console = chat_console_with_mocks
+        console.console = Console(file=io.StringIO(), width=40)
+        console.start_streaming()
+        console.stream_chunk("Hello there!")
+
+        assert console.finish_streaming() == "Hello there!"
+        assert not console._markdown_cache
@@ -0,0 +1,99 @@
+"""Tests for how ChatConsole output reaches the terminal."""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from claude_clone.ui import console as console_module
+
+
+class CountingFile(io.StringIO):
+    """StringIO that counts write() calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+@pytest.fixture
+def counted_console(chat_console_with_mocks):
+    """Provide a ChatConsole writing to a CountingFile."""
+    console = chat_console_with_mocks
+    console.console = Console(file=CountingFile(), width=60)
+    return console
+
+
+class TestBufferedWrites:
+    """Tests for grouping multi-part output into one write."""
+
+    def test_user_message_single_write(self, counted_console):
+        """Verify the spacer line is printed with the panel."""
+        counted_console.print_user_message("hello")
+
+        output = counted_console.console.file.getvalue()
+        assert counted_console.console.file.writes == 1
+        assert output.startswith("\n╭")
+        assert "hello" in output
+
+    def test_tool_result_with_preview_single_write(self, counted_console):
+        """Verify the summary line and file preview are written together."""
+        content = "\n".join(f"line {i}" for i in range(8))
+
+        counted_console.print_tool_result("Wrote 8 lines", content=content, file_path="a.py")
+
+        output = counted_console.console.file.getvalue()
+        assert counted_console.console.file.writes == 1
+        assert "Wrote 8 lines" in output
+        assert "line 0" in output
+        assert counted_console._collapsed_results[-1]["file_path"] == "a.py"
+
+
+class TestToolResultText:
+    """Tests for printing tool output as plain text."""
+
+    def test_brackets_in_output_kept(self, counted_console):
+        """Verify bracketed tool output is not treated as markup."""
+        counted_console.print_tool_result("matched [bold] and [/x]")
+
+        assert "matched [bold] and [/x]" in counted_console.console.file.getvalue()
+
+    def test_error_output_kept(self, counted_console):
+        """Verify bracketed error output is not treated as markup."""
+        counted_console.print_tool_result("bad [red]", success=False)
+
+        assert "Error: bad [red]" in counted_console.console.file.getvalue()
+
+    def test_preview_indicator(self, counted_console):
+        """Verify the preview lists hidden lines and keeps content literal."""
+        preview, total = counted_console._format_file_preview("[a]\nb\nc", max_lines=1)
+
+        assert total == 3
+        assert preview.plain == "     1 [a]\n     ... +2 lines (ctrl+o to expand)"
+
+    def test_long_output_capped(self, counted_console):
+        """Verify long tool output is cut with a count of hidden characters."""
+        counted_console.console.width = 200
+        output = "x" * (console_module.TOOL_RESULT_DISPLAY_CHARS + 500)
+
+        counted_console.print_tool_result(output)
+
+        printed = counted_console.console.file.getvalue()
+        assert "…[500 more chars]" in printed
+        assert printed.count("x") == console_module.TOOL_RESULT_DISPLAY_CHARS
+
+
+class TestWelcome:
+    """Tests for the welcome panel."""
+
+    def test_names_shown_literally(self, counted_console):
+        """Verify model and session names are not parsed as markup."""
+        counted_console.print_welcome("model[bold]", "id[/x]")
+
+        output = counted_console.console.file.getvalue()
+        assert "Model: model[bold]" in output
+        assert "Session: id[/x]" in output
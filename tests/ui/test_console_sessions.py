@@ -0,0 +1,105 @@
+"""Tests for session and model listing output."""
+
+from datetime import datetime
+
+from rich.text import Text
+
+from claude_clone.core.session import SessionMetadata
+from claude_clone.ui.console import format_session_time
+
+
+class TestFormatSessionTime:
+    """Tests for format_session_time()."""
+
+    def test_isoformat_timestamp(self):
+        """Verify isoformat() output is trimmed to minutes."""
+        stamp = datetime(2024, 3, 5, 14, 7, 59, 123456).isoformat()
+        assert format_session_time(stamp) == "2024-03-05 14:07"
+
+    def test_space_separated_timestamp(self):
+        """Verify a space separator falls back to fromisoformat()."""
+        assert format_session_time("2024-03-05 14:07:59") == "2024-03-05 14:07"
+
+    def test_unparseable_value_is_truncated(self):
+        """Verify unparseable values are shown truncated."""
+        assert format_session_time("not a timestamp at all") == "not a timestamp "
+
+    def test_date_only_value(self):
+        """Verify a bare date still parses through fromisoformat()."""
+        assert format_session_time("2024-03-05") == "2024-03-05 00:00"
+
+    def test_invalid_date_is_truncated(self):
+        """Verify a year-prefixed value that fails to parse is shown truncated."""
+        assert format_session_time("2024-13-45 junk") == "2024-13-45 junk"
+
+    def test_missing_value(self):
+        """Verify empty and missing values show as unknown."""
+        assert format_session_time("") == "unknown"
+        assert format_session_time(None) == "unknown"
+
+
+class TestListingOutput:
+    """Tests for printing session and model lists."""
+
+    def test_sessions_printed_in_one_call(self, chat_console_with_mocks):
+        """Verify the whole session list is written with a single print."""
+        console = chat_console_with_mocks
+        sessions = [
+            SessionMetadata(
+                id=f"s{i}",
+                model="m",
+                created_at="2024-03-05T14:07:00",
+                updated_at="2024-03-05T14:07:00",
+                message_count=2,
+                title=f"Title {i}",
+            )
+            for i in range(5)
+        ]
+
+        console.print_sessions(sessions)
+
+        console.console.print.assert_called_once()
+        text = console.console.print.call_args.args[0]
+        assert "s4" in text
+        assert "2024-03-05 14:07" in text
+
+    def test_models_printed_in_one_call(self, chat_console_with_mocks):
+        """Verify the model list is written with a single print."""
+        console = chat_console_with_mocks
+
+        console.print_models(["a", "b"], "b")
+
+        console.console.print.assert_called_once()
+        assert "2. b (active)" in console.console.print.call_args.args[0]
+
+
+class TestLineBuffer:
+    """Tests for write()/writeln() line buffering."""
+
+    def test_write_defers_output(self, chat_console_with_mocks):
+        """Verify write() buffers fragments until writeln()."""
+        console = chat_console_with_mocks
+
+        console.write("a", "b")
+        console.console.print.assert_not_called()
+
+        console.writeln("c")
+        console.console.print.assert_called_once_with("abc")
+        assert console._line_buffer == []
+
+    def test_writeln_keeps_renderables(self, chat_console_with_mocks):
+        """Verify Text fragments are passed through unjoined."""
+        console = chat_console_with_mocks
+        text = Text("b")
+
+        console.writeln("a", text)
+
+        console.console.print.assert_called_once_with("a", text, sep="")
+
+    def test_writeln_passes_print_options(self, chat_console_with_mocks):
+        """Verify print keyword arguments are forwarded."""
+        console = chat_console_with_mocks
+
+        console.writeln("x", markup=False, end="")
+
+        console.console.print.assert_called_once_with("x", markup=False, end="")
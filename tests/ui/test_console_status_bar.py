@@ -0,0 +1,101 @@
+"""Tests for the ChatConsole status bar."""
+
+import time
+
+import pytest
+
+from claude_clone.config import PermissionMode, permission_mode_manager
+
+
+@pytest.fixture
+def normal_mode():
+    """Restore the shared permission mode after a test changes it."""
+    permission_mode_manager.set_mode(PermissionMode.NORMAL)
+    yield
+    permission_mode_manager.set_mode(PermissionMode.NORMAL)
+
+
+class TestStatusBarCache:
+    """Tests for status bar fragment caching."""
+
+    def test_static_fragments_reused_between_calls(self, chat_console_with_mocks):
+        """Verify unchanged state reuses the cached fragments."""
+        console = chat_console_with_mocks
+
+        console._get_status_bar()
+        static = console._status_bar_static
+        console._get_status_bar()
+
+        assert console._status_bar_static is static
+
+    def test_update_status_bar_rebuilds(self, chat_console_with_mocks):
+        """Verify new context usage shows up in the next status bar."""
+        console = chat_console_with_mocks
+        console._get_status_bar()
+
+        console.update_status_bar(context_used=1234, context_max=10000)
+
+        status_text = "".join(part[1] for part in console._get_status_bar())
+        assert "1,234/10,000" in status_text
+
+    def test_bar_full_when_over_limit(self, chat_console_with_mocks):
+        """Verify usage past the context limit draws a full bar."""
+        console = chat_console_with_mocks
+        console.update_status_bar(context_used=12000, context_max=10000)
+
+        status_text = "".join(part[1] for part in console._get_status_bar())
+        assert "█" * 10 in status_text
+        assert "░" not in status_text
+
+    def test_context_usage_over_limit(self, chat_console_with_mocks):
+        """Verify print_context_usage handles usage past the limit."""
+        console = chat_console_with_mocks
+
+        console.print_context_usage(12000, 10000, 120.0)
+
+        console.console.print.assert_called()
+
+
+class TestStatusBarMode:
+    """Tests for the permission mode section of the status bar."""
+
+    def test_cycle_updates_mode(self, chat_console_with_mocks, mock_event, normal_mode):
+        """Verify cycling the mode shows the new mode and its color."""
+        console = chat_console_with_mocks
+        assert ("ansigreen", "● Normal") in console._get_status_bar()
+
+        console._on_cycle_permission(mock_event)
+
+        assert ("ansiyellow", "● Auto") in console._get_status_bar()
+
+    def test_set_mode_updates_mode(self, chat_console_with_mocks, normal_mode):
+        """Verify a mode change made without a keypress is still shown."""
+        console = chat_console_with_mocks
+        console._get_status_bar()
+
+        permission_mode_manager.set_mode(PermissionMode.PLAN_MODE)
+
+        assert ("ansicyan", "● Plan") in console._get_status_bar()
+
+
+class TestStatusBarClock:
+    """Tests for the session clock in the status bar."""
+
+    def test_elapsed_time_shown(self, chat_console_with_mocks):
+        """Verify the clock shows time since the monotonic session start."""
+        console = chat_console_with_mocks
+        console._status_data["session_start"] = time.monotonic() - 3725
+
+        assert ("ansigray", "1h 2m") in console._get_status_bar()
+
+    def test_clock_fragments_reused_within_second(self, chat_console_with_mocks):
+        """Verify the clock fragments are only rebuilt when the second changes."""
+        console = chat_console_with_mocks
+        console._status_data["session_start"] = time.monotonic() - 65.5
+
+        console._get_status_bar()
+        fragments = console._status_bar_time
+        console._get_status_bar()
+
+        assert console._status_bar_time is fragments
+        assert fragments[0] == ("ansigray", "1m 5s")
@@ -0,0 +1,56 @@
+"""Tests for plain streaming output."""
+
+import io
+
+from rich.console import Console
+
+from claude_clone.ui import console as console_module
+
+
+class TestStreamingChunks:
+    """Tests for coalescing print_streaming_chunk() writes."""
+
+    def test_chunks_held_until_newline(self, chat_console_with_mocks):
+        """Verify partial-line chunks are written together at the newline."""
+        console = chat_console_with_mocks
+
+        console.print_streaming_chunk("Hel")
+        console.print_streaming_chunk("lo")
+        console.console.print.assert_not_called()
+
+        console.print_streaming_chunk(" world\n")
+        console.console.print.assert_called_once_with("Hello world\n", end="", markup=False)
+
+    def test_flushed_at_size_cap(self, chat_console_with_mocks):
+        """Verify a long line is written once the cap is reached."""
+        console = chat_console_with_mocks
+        chunk = "x" * (console_module.STREAM_FLUSH_CHARS // 2)
+
+        console.print_streaming_chunk(chunk)
+        console.console.print.assert_not_called()
+        console.print_streaming_chunk(chunk)
+
+        console.console.print.assert_called_once_with(chunk * 2, end="", markup=False)
+
+    def test_end_flushes_remainder(self, chat_console_with_mocks):
+        """Verify ending the stream writes the held back tail."""
+        console = chat_console_with_mocks
+
+        console.print_streaming_chunk("tail")
+        console.print_streaming_end()
+
+        calls = console.console.print.call_args_list
+        assert calls[0].args == ("tail",)
+        assert calls[1].args == ()
+        assert console._stream_buffer == []
+
+    def test_plain_output_bypasses_rich(self, chat_console_with_mocks):
+        """Verify streamed text is written as-is when output is not a terminal."""
+        console = chat_console_with_mocks
+        console.console = Console(file=io.StringIO(), width=20)
+        console._plain_output = True
+        long_line = "word " * 20
+
+        console.print_streaming_chunk(long_line + "\n")
+
+        assert console.console.file.getvalue() == long_line + "\n"
@@ -0,0 +1,45 @@
+"""Tests for tool call display formatting."""
+
+from claude_clone.ui.console import short_arg
+
+
+class TestShortArg:
+    """Tests for short_arg()."""
+
+    def test_short_string_unchanged(self):
+        """Verify strings within the limit are shown as-is."""
+        assert short_arg("ls -la") == "ls -la"
+
+    def test_long_string_truncated(self):
+        """Verify long strings are cut to the limit with an ellipsis."""
+        result = short_arg("x" * 10_000_000)
+        assert result == "x" * 47 + "..."
+
+    def test_non_string_value_bounded(self):
+        """Verify non-string values are summarized within the limit."""
+        result = short_arg(list(range(1_000_000)))
+        assert len(result) <= 50
+        assert result.startswith("[0, 1, 2")
+
+    def test_long_command_in_display_info(self, chat_console_with_mocks):
+        """Verify long shell commands are truncated in the tool call line."""
+        _, primary_arg = chat_console_with_mocks._get_tool_display_info(
+            "bash", {"command": "echo " + "a" * 100}
+        )
+        assert len(primary_arg) == 50
+        assert primary_arg.endswith("...")
+
+    def test_long_path_shown_in_full(self, chat_console_with_mocks):
+        """Verify file paths are not shortened."""
+        path = "/very/long/" + "nested/" * 20 + "file.py"
+        _, primary_arg = chat_console_with_mocks._get_tool_display_info(
+            "read_file", {"file_path": path}
+        )
+        assert primary_arg == path
+
+    def test_non_string_path_bounded(self, chat_console_with_mocks):
+        """Verify a malformed non-string path argument is summarized."""
+        _, primary_arg = chat_console_with_mocks._get_tool_display_info(
+            "read_file", {"path": ["a"] * 1_000_000}
+        )
+        assert len(primary_arg) <= 50
@@ -0,0 +1,97 @@
+"""Tests for KeyBindingManager."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from prompt_toolkit.keys import Keys
+
+from claude_clone.ui import keybindings
+from claude_clone.ui.keybindings import KeyBindingManager
+
+
+@pytest.fixture
+def manager():
+    """Provide a KeyBindingManager with mock callbacks registered."""
+    manager = KeyBindingManager()
+    for action in ("toggle_thinking", "cycle_permission", "interrupt", "edit_previous"):
+        manager.register_callback(action, MagicMock(name=action))
+    return manager
+
+
+def press(manager, key, event=None):
+    """Run the handler bound to key."""
+    event = event or MagicMock()
+    (binding,) = manager.bindings.get_bindings_for_keys((key,))
+    binding.handler(event)
+    return event
+
+
+class TestEscape:
+    """Tests for single and double Escape handling."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Provide a controllable monotonic_ns() clock."""
+        now = [10_000_000_000]
+        monkeypatch.setattr(keybindings, "monotonic_ns", lambda: now[0])
+        return now
+
+    def test_single_escape_interrupts(self, manager, clock):
+        """Verify one Escape triggers interrupt only."""
+        press(manager, Keys.Escape)
+
+        manager._callbacks["interrupt"].assert_called_once()
+        manager._callbacks["edit_previous"].assert_not_called()
+
+    def test_double_escape_edits_previous(self, manager, clock):
+        """Verify two quick Escapes trigger edit_previous."""
+        press(manager, Keys.Escape)
+        clock[0] += 200_000_000
+        press(manager, Keys.Escape)
+
+        manager._callbacks["interrupt"].assert_called_once()
+        manager._callbacks["edit_previous"].assert_called_once()
+
+    def test_slow_escapes_interrupt_twice(self, manager, clock):
+        """Verify Escapes outside the window each interrupt."""
+        press(manager, Keys.Escape)
+        clock[0] += 600_000_000
+        press(manager, Keys.Escape)
+
+        assert manager._callbacks["interrupt"].call_count == 2
+        manager._callbacks["edit_previous"].assert_not_called()
+
+    def test_four_quick_escapes_edit_twice(self, manager, clock):
+        """Verify a quick third Escape starts a new pair."""
+        for _ in range(4):
+            press(manager, Keys.Escape)
+            clock[0] += 100_000_000
+
+        manager._callbacks["interrupt"].assert_called_once()
+        assert manager._callbacks["edit_previous"].call_count == 2
+
+
+class TestCallbackDispatch:
+    """Tests for dispatching keys to registered callbacks."""
+
+    def test_shift_tab_cycles_permission(self, manager):
+        """Verify Shift+Tab calls the cycle_permission callback."""
+        event = press(manager, Keys.BackTab)
+
+        manager._callbacks["cycle_permission"].assert_called_once_with(event)
+
+    def test_tab_on_empty_buffer_toggles_thinking(self, manager):
+        """Verify Tab with no text toggles thinking."""
+        event = MagicMock()
+        event.app.current_buffer.text = ""
+
+        press(manager, Keys.Tab, event)
+
+        manager._callbacks["toggle_thinking"].assert_called_once_with(event)
+
+    def test_unregistered_action_ignored(self):
+        """Verify keys without a registered callback do nothing."""
+        manager = KeyBindingManager()
+
+        press(manager, Keys.BackTab)
+        press(manager, Keys.ControlO)
@@ -0,0 +1,51 @@
+"""Tests for slash command autocompletion."""
+
+import pytest
+from prompt_toolkit.document import Document
+
+from claude_clone.ui.console import SLASH_COMMANDS, SlashCommandCompleter
+
+
+def complete(text):
+    """Return (text, start_position) for each completion of text."""
+    completer = SlashCommandCompleter()
+    return [
+        (c.text, c.start_position)
+        for c in completer.get_completions(Document(text), None)
+    ]
+
+
+class TestSlashCommandCompleter:
+    """Tests for SlashCommandCompleter."""
+
+    def test_slash_lists_all_commands(self):
+        """Verify a lone slash offers every command in order."""
+        assert [cmd for cmd, _ in complete("/")] == list(SLASH_COMMANDS)
+
+    def test_prefix_filters_commands(self):
+        """Verify only commands with the typed prefix are offered."""
+        assert complete("/mo") == [("/models", -3), ("/model", -3)]
+
+    def test_full_command_matches_itself(self):
+        """Verify a complete command still completes to itself."""
+        assert ("/quit", -5) in complete("/quit")
+
+    @pytest.mark.parametrize("text", ["", "help", "/nope", "/help me"])
+    def test_no_completions(self, text):
+        """Verify non-command text yields nothing."""
+        assert complete(text) == []
+
+    def test_display_meta_is_description(self):
+        """Verify completions carry the command description."""
+        completion = next(SlashCommandCompleter().get_completions(Document("/he"), None))
+
+        assert completion.display_meta_text == SLASH_COMMANDS["/help"]
+
+    def test_completions_are_reused(self):
+        """Verify repeated completions return the prebuilt objects."""
+        completer = SlashCommandCompleter()
+        first = list(completer.get_completions(Document("/s"), None))
+        second = list(completer.get_completions(Document("/s"), None))
+
+        assert [c.text for c in first] == ["/save", "/sessions"]
+        assert all(a is b for a, b in zip(first, second))
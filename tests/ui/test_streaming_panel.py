@@ -0,0 +1,180 @@
+"""Tests for StreamingPanel."""
+
+import io
+
+import pytest
+from rich.console import Console
+from rich.panel import Panel
+
+from claude_clone.ui.console import (
+    SYNC_OUTPUT_BEGIN,
+    SYNC_OUTPUT_END,
+    StatusSpinner,
+    StreamingPanel,
+    supports_synchronized_output,
+)
+
+
+@pytest.fixture
+def panel():
+    """Provide a StreamingPanel writing to an in-memory console."""
+    console = Console(file=io.StringIO(), width=60)
+    return StreamingPanel(console)
+
+
+class TestStreamingPanel:
+    """Tests for StreamingPanel streaming and rendering."""
+
+    def test_finish_returns_all_chunks(self, panel):
+        """Verify appended chunks are returned joined on finish."""
+        panel.start()
+        for chunk in ["Hel", "lo ", "world"]:
+            panel.append(chunk)
+
+        assert panel.finish() == "Hello world"
+        assert panel.live is None
+
+    def test_finish_with_final_panel_draws_it_once(self, panel):
+        """Verify the final panel replaces the streaming one and stays."""
+        panel.start()
+        panel.append("raw text")
+
+        panel.finish(Panel("Final answer"))
+
+        output = panel.console.file.getvalue()
+        assert output.count("Final answer") == 1
+        assert "▌" not in output
+
+    def test_finish_without_final_panel_erases(self, panel):
+        """Verify a discarded stream leaves nothing behind."""
+        panel.start()
+        panel.append("tool call json")
+
+        panel.finish()
+
+        assert "tool call json" not in panel.console.file.getvalue()
+
+    def test_append_does_not_render(self, panel, monkeypatch):
+        """Verify append only records content; rendering is left to Live."""
+        panel.start()
+        renders = []
+        monkeypatch.setattr(panel, "_render", lambda: renders.append(1))
+
+        for _ in range(100):
+            panel.append("x")
+
+        assert renders == []
+        panel.finish()
+
+    def test_render_shows_cursor(self, panel):
+        """Verify the in-progress panel ends with the streaming cursor."""
+        panel.append("partial")
+
+        assert panel._render().renderable.plain == "partial▌"
+
+    def test_title_parsed_once(self, panel):
+        """Verify every frame reuses the pre-parsed title."""
+        first = panel._render().title
+        panel.append("more")
+
+        assert panel._render().title is first
+        assert first.plain == "SkyNet"
+
+    def test_content_joined_once_per_append(self, panel):
+        """Verify content is reused until another chunk arrives."""
+        panel.append("a")
+        panel.append("b")
+        first = panel.content
+
+        assert panel.content is first
+        panel.append("c")
+        assert panel.content == "abc"
+
+
+class TestSpinnerHandOff:
+    """Tests for sharing one Live between the spinner and streaming panel."""
+
+    def test_streaming_takes_over_spinner_live(self, panel):
+        """Verify the streaming panel reuses the spinner's running Live."""
+        spinner = StatusSpinner(panel.console)
+        spinner.start("Thinking...")
+        live = spinner.live
+
+        panel.start(spinner.hand_off())
+        panel.append("answer")
+
+        assert spinner.live is None
+        assert panel.live is live
+        assert live.is_started
+        assert panel.finish() == "answer"
+        assert not live.is_started
+
+    def test_restart_reuses_running_spinner(self, panel):
+        """Verify starting a running spinner only updates its message."""
+        spinner = StatusSpinner(panel.console)
+        spinner.start("Thinking...")
+        live = spinner.live
+
+        spinner.start("Running tool...")
+
+        assert spinner.live is live
+        assert spinner.message == "Running tool..."
+        spinner.stop()
+
+    def test_update_keeps_spinner(self, panel):
+        """Verify updating the message changes the text of the same spinner."""
+        spinner = StatusSpinner(panel.console)
+        spinner.start("Thinking...")
+        renderable = spinner.live._renderable
+
+        spinner.update("Reading files...")
+
+        assert spinner.live._renderable is renderable
+        assert renderable.text.plain == "Reading files..."
+        spinner.stop()
+
+    def test_text_shared_across_restarts(self, panel):
+        """Verify restarted spinners reuse the same dim Text object."""
+        spinner = StatusSpinner(panel.console)
+        spinner.start("Thinking...")
+        text = spinner.live._renderable.text
+        spinner.stop()
+
+        spinner.start("Again...")
+
+        assert spinner.live._renderable.text is text
+        assert text.plain == "Again..."
+        assert text.style == "dim"
+        spinner.stop()
+
+
+class TestSynchronizedOutput:
+    """Tests for synchronized output around Live refreshes."""
+
+    @pytest.mark.parametrize(
+        "env,expected",
+        [
+            ({"TERM_PROGRAM": "WezTerm"}, True),
+            ({"TERM": "xterm-kitty"}, True),
+            ({"WT_SESSION": "abc"}, True),
+            ({"TERM": "xterm-256color"}, False),
+            ({}, False),
+        ],
+    )
+    def test_detection(self, env, expected):
+        """Verify supporting terminals are recognised from the environment."""
+        assert supports_synchronized_output(env) is expected
+
+    @pytest.mark.parametrize("sync_output", [True, False])
+    def test_frames_wrapped_only_when_enabled(self, sync_output):
+        """Verify refreshes are bracketed by mode 2026 markers when enabled."""
+        console = Console(file=io.StringIO(), force_terminal=True, width=40)
+        panel = StreamingPanel(console, sync_output=sync_output)
+        panel.start()
+        panel.append("hello")
+        panel.live.refresh()
+        panel.finish()
+
+        output = console.file.getvalue()
+        assert (SYNC_OUTPUT_BEGIN in output) is sync_output
+        assert output.count(SYNC_OUTPUT_BEGIN) == output.count(SYNC_OUTPUT_END)